@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Recipe QA Validator Benchmark
+=============================
+Generates synthetic cookbook projects shaped like "Mastering Pasta"
+(inventory, index and Schema.org recipe pages) and times
+RecipeProjectValidator.validate_all() on them, phase by phase as recorded
+by its PhaseTimings, to catch scaling regressions.
+
+Each size runs in a fresh process so peak RSS is measured per size.
+Results are printed (or written with --output) as JSON.
+
+Usage:
+    python recipe-qa-benchmark.py
+    python recipe-qa-benchmark.py --sizes 100 1000 10000 100000 --output bench.json
+    python recipe-qa-benchmark.py --prefetch 8 --cache
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import itertools
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import tempfile
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+PROJECT_NAME = "Synthetic Pasta"
+
+DEFAULT_SIZES = [100, 1000, 10000]
+
+_SHAPES = ['Pappardelle', 'Tagliatelle', 'Ravioli', 'Gnocchi', 'Risotto', 'Cannelloni',
+           'Fettuccine', 'Agnolotti', 'Orecchiette', 'Cavatelli', 'Lasagna', 'Tortellini']
+_MAINS = ['Rabbit Ragù', 'Porcini', 'Crab', 'Lamb', 'Sweetbreads', 'Duck', 'Octopus',
+          'Chestnut', 'Squash', 'Morels', 'Lobster', 'Sausage', 'Scallops', 'Artichokes']
+_EXTRAS = ['Peaches', 'Brown Butter', 'Mint', 'Lemon Zest', 'Pecorino', 'Walnuts',
+           'Fava Crema', 'Sage', 'Bread Crumbs', 'Tomato Butter', 'Fennel Pollen', 'Burrata']
+# Syllables for made-up place names, so names are as varied as a real cookbook's
+_SYLLABLES = ['ca', 'lo', 'ri', 'ta', 've', 'no', 'mi', 'sa', 'pe', 'gu',
+              'bro', 'fi', 'tor', 'len', 'dan', 'mar', 'sel', 'qui', 'zo', 'ber']
+# Building blocks for ingredient lines and steps, so no two pages share their text
+_PANTRY = _MAINS + _EXTRAS + ['Olive Oil', 'Garlic', 'Shallots', 'White Wine', 'Parmigiano',
+                              'Thyme', 'Chili Flakes', 'Cream', 'Semolina', 'Egg Yolks']
+_UNITS = ['g', 'ml', 'tablespoons', 'teaspoons', 'cups', 'ounces']
+_VERBS = ['Simmer', 'Toss', 'Sear', 'Fold', 'Roast', 'Whisk', 'Braise', 'Blanch', 'Reduce', 'Season']
+_STEP_ENDINGS = ['until glossy', 'over low heat', 'for 2 minutes', 'until tender', 'in batches',
+                 'with a pinch of salt', 'until golden', 'off the heat', 'in a wide pan', 'to taste']
+
+_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>{name}</title>
+    <style>
+        body {{ font-family: Georgia, serif; max-width: 800px; margin: 0 auto; }}
+        h1 {{ color: #8B4513; }}
+    </style>
+</head>
+<body>
+    <article itemscope itemtype="http://schema.org/Recipe">
+        <img itemprop="image" src="IMG_0001.JPG" alt="Synthetic cookbook cover">
+        <h1 itemprop="name">{name}</h1>
+        <div class="recipe-meta">
+            <span itemprop="recipeYield">Makes 4 to 6 servings</span>
+        </div>
+        <div class="description" itemprop="description">
+            <p>A synthetic recipe generated for benchmarking, number {number}.</p>
+        </div>
+        <h2>Ingredients</h2>
+        <ul>
+{ingredients}
+        </ul>
+        <h2>Instructions</h2>
+        <ol>
+{instructions}
+        </ol>
+    </article>
+</body>
+</html>
+"""
+
+
+def _load_validator():
+    """Import recipe-qa-validator.py (its hyphenated name is not importable)"""
+    path = Path(__file__).with_name('recipe-qa-validator.py')
+    spec = importlib.util.spec_from_file_location('recipe_qa_validator', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _place_name(number: int) -> str:
+    """A pronounceable made-up place name, unique per number"""
+    syllables = []
+    while True:
+        number, digit = divmod(number, len(_SYLLABLES))
+        syllables.append(_SYLLABLES[digit])
+        if number == 0:
+            break
+    return ''.join(syllables).capitalize()
+
+
+def _recipe_names(count: int) -> List[str]:
+    """Unique, realistic-looking recipe names"""
+    combos = itertools.cycle(itertools.product(_SHAPES, _MAINS, _EXTRAS))
+    return [
+        f"{shape} with {main} and {extra} alla {_place_name(i + len(_SYLLABLES))}"
+        for i, (shape, main, extra) in zip(range(count), combos)
+    ]
+
+
+def _slug(name: str) -> str:
+    ascii_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    return '-'.join(''.join(c if c.isalnum() else ' ' for c in ascii_name.lower()).split())
+
+
+def generate_project(github_folder: Path, count: int):
+    """Write a synthetic project (inventory, index, recipe pages) into github_folder"""
+    recipe_folder = github_folder / PROJECT_NAME
+    recipe_folder.mkdir(parents=True)
+    names = _recipe_names(count)
+    
+    inventory = [
+        f"# {PROJECT_NAME} - Recipe Inventory",
+        "",
+        "## Progress Statistics",
+        f"- **Total recipes:** {count}",
+        f"- **Completed:** {count}",
+        "- **Missing:** 0",
+        "",
+        "## Recipes",
+        "",
+    ]
+    links = []
+    
+    for number, name in enumerate(names, 1):
+        filename = _slug(name) + '.html'
+        # Some page titles are near-misses, to exercise fuzzy matching
+        page_name = name.replace(' with ', ' wth ') if number % 20 == 0 else name
+        rng = random.Random(number)
+        ingredients = '\n'.join(
+            f'            <li itemprop="recipeIngredient">{rng.randint(1, 500)} {rng.choice(_UNITS)} {item}</li>'
+            for item in rng.sample(_PANTRY, 6)
+        )
+        instructions = '\n'.join(
+            f'            <li itemprop="recipeInstructions">{rng.choice(_VERBS)} the {first.lower()} with the '
+            f'{second.lower()} {rng.choice(_STEP_ENDINGS)}, then {rng.choice(_VERBS).lower()} '
+            f'{rng.choice(_STEP_ENDINGS)}.</li>'
+            for first, second in zip(rng.sample(_PANTRY, 4), rng.sample(_PANTRY, 4))
+        )
+        page = _PAGE_TEMPLATE.format(name=page_name, number=number,
+                                     ingredients=ingredients, instructions=instructions)
+        (recipe_folder / filename).write_text(page, encoding='utf-8')
+        
+        inventory.append(f"- [x] {name} (p.{number})")
+        links.append((name, filename))
+    
+    (recipe_folder / 'recipe-inventory.md').write_text('\n'.join(inventory) + '\n', encoding='utf-8')
+    
+    index_lines = ['<!DOCTYPE html>', '<html lang="en">', '<body>', '    <ul>']
+    for name, filename in sorted(links, key=lambda link: link[0].lower()):
+        index_lines.append(f'        <li><a href="{PROJECT_NAME}/{filename}">{name}</a></li>')
+    index_lines += ['    </ul>', '</body>', '</html>']
+    index_name = PROJECT_NAME.lower().replace(' ', '-') + '.html'
+    (github_folder / index_name).write_text('\n'.join(index_lines) + '\n', encoding='utf-8')
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _phase_results(validator, count: int) -> Dict:
+    """Per-phase seconds and throughput recorded by the validator's PhaseTimings"""
+    phases = {}
+    for record in validator.timings.phases:
+        phase = phases.setdefault(record['name'], {'seconds': 0.0, 'files': 0, 'bytes_read': 0,
+                                                   'cache_hits': 0, 'cache_misses': 0})
+        for key in phase:
+            phase[key] += record[key]
+    for phase in phases.values():
+        seconds = phase['seconds']
+        phase['seconds'] = round(seconds, 6)
+        phase['files_per_second'] = round(count / seconds, 1) if seconds else None
+    return phases
+
+
+def _timed_run(validator_module, github_folder: Path, count: int, cache, prefetch: int) -> Dict:
+    """Run validate_all() once and report its wall time and phases"""
+    validator = validator_module.RecipeProjectValidator(str(github_folder), PROJECT_NAME, cache,
+                                                        prefetch_concurrency=prefetch)
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        validator.validate_all()
+        total = time.perf_counter() - started
+    return {
+        'total_seconds': round(total, 6),
+        'files_per_second': round(count / total, 1) if total else None,
+        'phases': _phase_results(validator, count),
+        'errors': validator.finding_counts['error'],
+        'warnings': validator.finding_counts['warning'],
+    }
+
+
+def run_benchmark(count: int, keep_dir: Optional[str] = None, prefetch: int = 0,
+                  cache: bool = False) -> Dict:
+    """Generate a project of count recipes and time validate_all() on it, phase by phase
+    
+    With cache, a second run reusing the first run's (in-memory) cache is
+    reported as 'warm'.
+    """
+    validator_module = _load_validator()
+    
+    with tempfile.TemporaryDirectory(dir=keep_dir) as tmp:
+        github_folder = Path(tmp)
+        started = time.perf_counter()
+        generate_project(github_folder, count)
+        generate_seconds = time.perf_counter() - started
+        
+        validation_cache = validator_module.ValidationCache(None, github_folder) if cache else None
+        result = {
+            'recipes': count,
+            'prefetch': prefetch,
+            'generate_seconds': round(generate_seconds, 6),
+            **_timed_run(validator_module, github_folder, count, validation_cache, prefetch),
+        }
+        if cache:
+            result['warm'] = _timed_run(validator_module, github_folder, count, validation_cache, prefetch)
+        result['peak_rss_bytes'] = _peak_rss_bytes()
+        return result
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description="Benchmark the recipe QA validator")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="number of recipes per synthetic project (default: 100 1000 10000)")
+    parser.add_argument('--output', help="write the JSON results to this file instead of stdout")
+    parser.add_argument('--tmp-dir', help="directory in which to generate the synthetic projects")
+    parser.add_argument('--prefetch', type=int, default=0, metavar='N',
+                        help="read files on N threads before checking, as --prefetch does (default: 0)")
+    parser.add_argument('--cache', action='store_true',
+                        help="also time a warm run that reuses the first run's cache")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point"""
+    args = parse_args(argv)
+    
+    results = []
+    for count in args.sizes:
+        print(f"⏱️  Benchmarking {count} recipes...", file=sys.stderr)
+        # A fresh process per size keeps peak RSS independent between runs
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results.append(pool.submit(run_benchmark, count, args.tmp_dir,
+                                           args.prefetch, args.cache).result())
+    
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    output = json.dumps(report, indent=2)
+    
+    if args.output:
+        Path(args.output).write_text(output + '\n', encoding='utf-8')
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
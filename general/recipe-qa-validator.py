@@ -11,20 +11,455 @@ This script validates recipe HTML projects to ensure:
 
 Usage:
     python recipe-qa-validator.py
+    python recipe-qa-validator.py --all [--jobs N] [--no-cache]
+    python recipe-qa-validator.py --project "Mastering Pasta" --watch
+    python recipe-qa-validator.py --all --timings --trace trace.json --profile
+    python recipe-qa-validator.py --all --format jsonl --strict > findings.jsonl
+    python recipe-qa-validator.py --staged --strict
+
+Exit status: 0 clean, 1 errors, 2 usage error, 3 warnings only (with --strict).
+Without a terminal on stdin and no --project, every project is validated.
 """
 
+import argparse
+import codecs
+import contextlib
+import cProfile
+import csv
+import hashlib
+import heapq
+import html
+import io
+import json
 import os
+import pstats
+import random
 import re
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.parse
+import unicodedata
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from html.parser import HTMLParser
-from typing import Dict, List, Set, Tuple
-from collections import defaultdict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from collections import defaultdict, deque
+
+
+# GitHub folder (hardcoded default, override with --root)
+DEFAULT_GITHUB_FOLDER = "/Users/michelle/Documents/GitHub/2vrxjtz5yr-ui.github.io"
+
+# Incremental validation cache, stored in the GitHub folder
+CACHE_FILE_NAME = '.recipe-qa-cache.json'
+
+# Concurrent file reads for single-project runs (--prefetch); off by default, since
+# streaming each file into the parser in turn is as fast on a local disk
+DEFAULT_PREFETCH_CONCURRENCY = 0
+
+# Functions listed by --profile
+PROFILE_TOP_FUNCTIONS = 25
+
+# Exit statuses
+EXIT_OK = 0
+EXIT_ERRORS = 1
+EXIT_USAGE = 2
+EXIT_WARNINGS = 3
+
+
+# Bytes read per step when streaming a recipe file into the parser
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Opening tag of an element whose body the schema checks never need
+_RAW_TEXT_OPEN = re.compile(r'<(style|script)\b[^>]*>', re.IGNORECASE)
+
+
+def iter_file_text(path: Path, chunk_size: int = STREAM_CHUNK_SIZE, digest=None) -> Iterator[str]:
+    """Yield a UTF-8 file's text in fixed-size chunks, hashing the raw bytes into digest"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(chunk_size)
+            if digest is not None:
+                digest.update(data)
+            if not data:
+                break
+            yield decoder.decode(data)
+    yield decoder.decode(b'', final=True)
+
+
+def _strip_raw_text(chunks: Iterable[str]) -> Iterator[str]:
+    """Drop the bodies of <style>/<script> elements from a stream of HTML text
+    
+    Large inline CSS and scripts are then never buffered by the parser.
+    JSON-LD scripts are kept since they carry recipe data.
+    """
+    buffer = ''
+    closing = None  # e.g. '</style' while inside a skipped element
+    
+    for chunk in chunks:
+        buffer += chunk
+        while buffer:
+            if closing is None:
+                match = _RAW_TEXT_OPEN.search(buffer)
+                if match is None or 'ld+json' in match.group(0).lower():
+                    end = len(buffer) if match is None else match.end()
+                    # Hold back a possibly incomplete tag until the next chunk
+                    cut = buffer.rfind('<', 0, end)
+                    if match is None and cut != -1 and '>' not in buffer[cut:]:
+                        end = cut
+                    yield buffer[:end]
+                    buffer = buffer[end:]
+                    if match is None:
+                        break
+                    continue
+                yield buffer[:match.end()]
+                closing = '</' + match.group(1).lower()
+                buffer = buffer[match.end():]
+            else:
+                index = buffer.lower().find(closing)
+                if index == -1:
+                    # Keep just enough to spot a closing tag split across chunks
+                    buffer = buffer[-(len(closing) - 1):]
+                    break
+                buffer = buffer[index:]
+                closing = None
+    
+    if closing is None and buffer:
+        yield buffer
+
+
+class RecipeResult:
+    """What the parser found in one recipe file
+    
+    One of these is held per file for the whole run (and per cached file in
+    the cache), so fields live in slots instead of a per-instance dict; the
+    cache stores the values as a plain list in FIELDS order.
+    """
+    
+    FIELDS = (
+        'has_schema', 'has_name', 'has_description', 'has_yield', 'has_image',
+        'name', 'title', 'recipe_yield', 'description', 'ingredient_count', 'instruction_count',
+        # recipeIngredient/recipeInstructions on the list instead of its items
+        'ingredients_on_parent', 'instructions_on_parent',
+        'images', 'links', 'ingredients', 'instructions', 'minhash',
+        # The page's JSON-LD Recipe, normalized by json_ld_recipe_fields() (None if it has none)
+        'json_ld',
+        # Rule name -> what the rule's parser hooks kept about the file
+        'rule_data',
+    )
+    __slots__ = FIELDS
+    
+    def __init__(self, **fields):
+        for field in self.FIELDS:
+            setattr(self, field, fields[field])
+    
+    @classmethod
+    def from_json(cls, values: List) -> 'RecipeResult':
+        """Rebuild a result from the list written by to_json()"""
+        result = cls.__new__(cls)
+        for field, value in zip(cls.FIELDS, values):
+            setattr(result, field, value)
+        return result
+    
+    def to_json(self) -> List:
+        """Field values in FIELDS order"""
+        return [getattr(self, field) for field in self.FIELDS]
+    
+    def __eq__(self, other):
+        if not isinstance(other, RecipeResult):
+            return NotImplemented
+        return self.to_json() == other.to_json()
+    
+    def __repr__(self):
+        return f"RecipeResult(name={self.name!r}, has_schema={self.has_schema!r})"
+
+
+# Message templates by finding code, filled in with the finding's args
+FINDING_MESSAGES = {
+    # structure
+    'recipe_folder_missing': "Recipe folder not found: {0}",
+    'inventory_missing': "Inventory file not found: {0}",
+    'index_missing': "Index file not found: {0}",
+    'start_page_missing': "Start page not found: {0}",
+    # inventory
+    'inventory_completed_mismatch': "Inventory statistics mismatch: Claims {0} completed, "
+                                    "but found {1} marked as [x]",
+    'inventory_missing_mismatch': "Inventory statistics mismatch: Claims {0} missing, but found {1} unchecked",
+    # schema
+    'missing_schema': "Missing Recipe schema (itemtype)",
+    'missing_name': "Missing recipe name (itemprop='name')",
+    'missing_description': "Missing description (itemprop='description')",
+    'missing_yield': "Missing yield (itemprop='recipeYield')",
+    'missing_image': "Missing image (itemprop='image')",
+    'no_ingredients': "No ingredients with itemprop='recipeIngredient'",
+    'no_instructions': "No instructions with itemprop='recipeInstructions'",
+    'ingredients_on_parent': "❌ CRITICAL: itemprop='recipeIngredient' found on parent element "
+                             "(must be on <li> tags)",
+    'instructions_on_parent': "❌ CRITICAL: itemprop='recipeInstructions' found on parent element "
+                              "(must be on <li> tags)",
+    # naming
+    'name_has_spaces': "{0}: Contains spaces (should use hyphens)",
+    'name_has_uppercase': "{0}: Contains uppercase letters (should be all lowercase)",
+    'name_has_special_chars': "{0}: Contains special characters (should only have letters, numbers, hyphens)",
+    # duplicates
+    'possible_duplicate': "{0} and {1}: Possible duplicate of '{2}' (text similarity {3:.2f})",
+    # images (the image, then the page(s) using it)
+    'image_missing': "{0}: Image not found (used by {1})",
+    'image_unknown_format': "{0}: Not a JPEG or PNG image (used by {1})",
+    'image_too_heavy': "{0}: {2} KB, over the {3} KB limit (used by {1})",
+    'image_too_large': "{0}: {2}x{3} px, larger than the {4} px a page needs (used by {1})",
+    'image_not_optimized': "{0}: Not web-optimized ({2} KB for {3}x{4} px; "
+                           "re-save at a lower quality or strip metadata) (used by {1})",
+    # cross_reference
+    'inventory_recipe_unmatched': "Recipe marked complete in inventory but no matching HTML found: {0}",
+    'inventory_recipe_fuzzy_match': "Inventory recipe only approximately matches {0} ({1:.0%} similar): {2}",
+    'file_not_in_index': "HTML file exists but not in index: {0}",
+    'index_links_missing_file': "Index links to non-existent file: {0}",
+    'file_not_linked': "HTML file not linked in index: {0}",
+    # alphabetical
+    'index_not_sorted': "Index is not in alphabetical order:",
+    'index_out_of_order': "{0} comes after {1}",
+    # site links
+    'broken_link': "{0}: Broken link to {1}",
+    'orphan_page': "{0}: No page links here",
+    'unreachable_page': "{0}: Linked only from pages that index.html cannot reach",
+}
+
+
+class Finding:
+    """One error or warning
+    
+    Severity, category and code are interned, so every finding of a kind
+    shares its strings; the message is only formatted from FINDING_MESSAGES
+    when a report or JSON output asks for it.
+    """
+    
+    __slots__ = ('project', 'file', 'category', 'severity', 'code', 'args')
+    
+    def __init__(self, project: str, severity: str, category: str, code: str,
+                 args: Tuple = (), file: Optional[str] = None):
+        self.project = project
+        self.severity = sys.intern(severity)
+        self.category = sys.intern(category)
+        self.code = sys.intern(code)
+        self.args = args
+        self.file = file
+    
+    @property
+    def message(self) -> str:
+        return FINDING_MESSAGES[self.code].format(*self.args)
+    
+    def to_dict(self) -> Dict:
+        """The finding as written by --format json/jsonl"""
+        return {
+            'project': self.project,
+            'file': self.file,
+            'category': self.category,
+            'severity': self.severity,
+            'code': self.code,
+            'message': self.message,
+        }
+    
+    def to_json(self) -> List:
+        """Compact form for the cache, which stores findings per project"""
+        return [self.severity, self.category, self.code, list(self.args), self.file]
+    
+    @classmethod
+    def from_json(cls, project: str, values: List) -> 'Finding':
+        """Rebuild a finding from the list written by to_json()"""
+        severity, category, code, args, file = values
+        return cls(project, severity, category, code, tuple(args), file)
+    
+    def _key(self) -> Tuple:
+        return (self.project, self.file, self.category, self.severity, self.code, self.args)
+    
+    def __eq__(self, other):
+        if not isinstance(other, Finding):
+            return NotImplemented
+        return self._key() == other._key()
+    
+    def __hash__(self):
+        return hash(self._key())
+    
+    def __repr__(self):
+        return f"Finding({self.severity}, {self.category}, {self.message!r})"
+
+
+class RecipeRule:
+    """A check plugged into validation; subclasses override the hooks they need
+    
+    Parser hooks (start_tag, itemprop_text) are called while a file is
+    parsed, in the same pass as the built-in checks, and end_document()
+    returns what the rule keeps about the file; it is cached with the parse
+    result. check_file() runs on that data for every file, parsed or cached,
+    and check_project() once per project. They yield (code, args) and
+    (code, args, file) respectively, with templates for the codes in messages.
+    """
+    
+    # Unique name, which keys the rule's per-file data
+    name = ''
+    category = ''
+    severity = 'warning'
+    # Finding code -> message template
+    messages: Dict[str, str] = {}
+    # Bump when end_document() changes, so cached files are parsed again
+    version = 1
+    # Projects the rule applies to (None: all of them)
+    projects: Optional[Tuple[str, ...]] = None
+    # itemprops whose element text is passed to itemprop_text()
+    itemprops: Tuple[str, ...] = ()
+    
+    @property
+    def listens_to_tags(self) -> bool:
+        return type(self).start_tag is not RecipeRule.start_tag
+    
+    @property
+    def listens_to_parser(self) -> bool:
+        return self.listens_to_tags or bool(self.itemprops)
+    
+    def applies_to(self, project_name: str) -> bool:
+        return self.projects is None or project_name in self.projects
+    
+    def start_document(self):
+        """Fresh per-file state for the parser hooks"""
+        return None
+    
+    def start_tag(self, state, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        """Called for every start tag"""
+    
+    def itemprop_text(self, state, itemprop: str, text: str):
+        """Called with the whitespace-normalized text of each element carrying one of self.itemprops"""
+    
+    def end_document(self, state):
+        """Per-file data to keep; must be JSON-serializable"""
+        return state
+    
+    def check_file(self, document: 'RecipeDocument', data) -> Iterator[Tuple[str, Tuple]]:
+        return iter(())
+    
+    def check_project(self, documents: List['RecipeDocument'], inventory_recipes: Dict,
+                      index_recipes: List[Dict]) -> Iterator[Tuple[str, Tuple, Optional[str]]]:
+        return iter(())
+
+
+# Registered rules, in registration order
+RULES: List[RecipeRule] = []
+
+
+def register_rule(rule_class: type) -> type:
+    """Class decorator adding a rule to RULES and its messages to FINDING_MESSAGES"""
+    rule = rule_class()
+    if any(existing.name == rule.name for existing in RULES):
+        raise ValueError(f"Duplicate rule name: {rule.name}")
+    FINDING_MESSAGES.update(rule.messages)
+    RULES.append(rule)
+    return rule_class
+
+
+def parser_rules() -> List[RecipeRule]:
+    """Registered rules with parser hooks"""
+    return [rule for rule in RULES if rule.listens_to_parser]
+
+
+def rule_signature() -> str:
+    """Names and versions of the parser rules, whose data parse results carry"""
+    return ','.join(f"{rule.name}:{rule.version}" for rule in parser_rules())
+
+
+@register_rule
+class YieldUnitRule(RecipeRule):
+    """recipeYield has to say what it yields, e.g. "4 to 6 servings" rather than "4 to 6\""""
+    
+    name = 'yield_unit'
+    category = 'yield'
+    messages = {
+        'yield_without_unit': "{0}: Yield '{1}' does not say what it yields (servings, cups, ...)",
+    }
+    # Mastering Pasta states every yield with its unit; other books' conventions differ
+    projects = ('Mastering Pasta',)
+    itemprops = ('recipeYield',)
+    # Words that do not name what is yielded, as in "Makes about 4"
+    FILLER_WORDS = {'to', 'or', 'and', 'about', 'approximately', 'makes', 'make'}
+    
+    def start_document(self):
+        return []
+    
+    def itemprop_text(self, state, itemprop, text):
+        state.append(text)
+    
+    def check_file(self, document, data):
+        for text in data:
+            if not set(re.findall(r'[^\W\d_]+', text.lower())) - self.FILLER_WORDS:
+                yield 'yield_without_unit', (document.name, text)
+
+
+# Cross-reference to another recipe in the book, e.g. "Egg Yolk Dough (page 26)"
+_PAGE_REFERENCE = re.compile(r'\(page (\d+)\)', re.IGNORECASE)
+
+
+@register_rule
+class PageReferenceRule(RecipeRule):
+    """Pages an ingredient refers to must be within an inventory recipe
+    
+    Recipes run over several pages (the flavoured doughs of p.143 are cited
+    as page 145), so a page counts if a recipe starts up to RECIPE_PAGES
+    pages before it.
+    """
+    
+    name = 'page_references'
+    category = 'page_references'
+    messages = {
+        'unknown_page_reference': "{0}: Ingredient refers to page {1}, where no inventory recipe is: {2}",
+    }
+    # The page numbers and spans below are those of Mastering Pasta
+    projects = ('Mastering Pasta',)
+    RECIPE_PAGES = 4
+    
+    def check_project(self, documents, inventory_recipes, index_recipes):
+        starts = {int(recipe['page']) for recipe in inventory_recipes.values()}
+        for document in documents:
+            for ingredient in document.result.ingredients:
+                for page in _PAGE_REFERENCE.findall(ingredient):
+                    if not any(int(page) - offset in starts for offset in range(self.RECIPE_PAGES)):
+                        yield 'unknown_page_reference', (document.name, page, ingredient), document.name
+
+
+@register_rule
+class JsonLdAgreementRule(RecipeRule):
+    """A page's JSON-LD Recipe must be valid and say the same as its microdata"""
+    
+    name = 'json_ld'
+    category = 'json_ld'
+    messages = {
+        'json_ld_invalid': "{0}: JSON-LD block could not be read ({1})",
+        'json_ld_mismatch': "{0}: JSON-LD {1} does not match the microdata",
+    }
+    
+    def check_file(self, document, data):
+        json_ld = document.result.json_ld
+        # Pages with no microdata are left to the schema check
+        if json_ld is None or not document.result.has_schema:
+            return
+        if '@error' in json_ld:
+            yield 'json_ld_invalid', (document.name, json_ld['@error'])
+            return
+        microdata = microdata_recipe_fields(document.result)
+        for field, value in microdata.items():
+            if json_ld.get(field) != value:
+                yield 'json_ld_mismatch', (document.name, field)
 
 
 class RecipeSchemaParser(HTMLParser):
     """Parse HTML and validate Schema.org recipe markup"""
     
-    def __init__(self):
+    # Properties that can be requested for an early-exit parse
+    PROPERTIES = ('schema', 'name', 'title', 'description', 'yield', 'image')
+    
+    def __init__(self, wanted: Optional[Set[str]] = None):
         super().__init__()
         self.has_recipe_schema = False
         self.has_name = False
@@ -37,17 +472,118 @@ class RecipeSchemaParser(HTMLParser):
         self.instructions_on_parent = False
         self.current_tag = None
         self.in_ul_or_ol = False
+        self.recipe_name = ''
+        self.title = ''
+        self.recipe_yield = ''
+        self.description = ''
+        self.json_ld: Optional[Dict] = None
+        self.ingredients: List[str] = []
+        self.instructions: List[str] = []
+        # src (or content/href) of every itemprop="image" element, and every link's href
+        self.images: List[str] = []
+        self.links: List[str] = []
+        # Text being collected ('name', 'title', 'yield', 'description', 'json_ld',
+        # 'ingredient' or 'instruction'), if any;
+        # depth counts nested tags of the same kind so the right end tag closes it
+        self._capture = None
+        self._capture_tag = None
+        self._capture_depth = 0
+        self._capture_text = []
+        # Subset of PROPERTIES after which feed_stream() may stop (None: parse everything)
+        self.wanted = set(wanted) if wanted is not None else None
+        # Registered rules listening to this parse, with their per-file state; open
+        # elements whose text a rule wants are [itemprop, tag, depth, text parts]
+        self._rules = parser_rules()
+        self._rule_states = [rule.start_document() for rule in self._rules]
+        self._tag_rules = [(rule, state) for rule, state in zip(self._rules, self._rule_states)
+                           if rule.listens_to_tags]
+        self._itemprop_rules: Dict[str, List[int]] = {}
+        for index, rule in enumerate(self._rules):
+            for prop in rule.itemprops:
+                self._itemprop_rules.setdefault(prop, []).append(index)
+        self._rule_captures: List[List] = []
+    
+    @property
+    def done(self) -> bool:
+        """True once every wanted property has been seen"""
+        if self.wanted is None:
+            return False
+        found = {
+            'schema': self.has_recipe_schema,
+            'name': bool(self.recipe_name),
+            'title': bool(self.title),
+            'description': self.has_description,
+            'yield': self.has_yield,
+            'image': self.has_image,
+        }
+        return all(found[prop] for prop in self.wanted)
+    
+    def feed_stream(self, chunks: Iterable[str]):
+        """Feed HTML text chunk by chunk, stopping early once done"""
+        for chunk in _strip_raw_text(chunks):
+            self.feed(chunk)
+            if self.done:
+                return
+        self.close()
         
     def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
+        # Only itemprop/itemtype and URLs matter, so skip building a dict for every tag
+        itemprop = itemtype = source = href = None
+        for key, value in attrs:
+            if key == 'itemprop':
+                itemprop = value
+            elif key == 'itemtype':
+                itemtype = value
+            elif key in ('src', 'content', 'href'):
+                if source is None:
+                    source = value
+                if key == 'href':
+                    href = value
+        
+        if href and tag in ('a', 'area'):
+            self.links.append(href.strip())
+        
+        for rule, state in self._tag_rules:
+            rule.start_tag(state, tag, attrs)
+        if self._rule_captures:
+            for capture in self._rule_captures:
+                if capture[1] == tag:
+                    capture[2] += 1
+        if itemprop in self._itemprop_rules:
+            if tag in _VOID_TAGS:
+                self._rule_text(itemprop, dict(attrs).get('content') or '')
+            else:
+                self._rule_captures.append([itemprop, tag, 0, []])
+        
+        # Collect the text of <title>, the first itemprop="name", "recipeYield" and
+        # "description" elements, every ingredient and instruction list item and
+        # JSON-LD scripts
+        if self._capture is None:
+            if tag == 'title' and not self.title:
+                self._start_capture('title', tag)
+            elif tag == 'script' and self.json_ld is None and \
+                    any(key == 'type' and value and 'ld+json' in value.lower() for key, value in attrs):
+                self._start_capture('json_ld', tag)
+            elif itemprop == 'name' and not self.recipe_name:
+                self._start_capture('name', tag, attrs)
+            elif itemprop == 'recipeYield' and not self.recipe_yield:
+                self._start_capture('yield', tag, attrs)
+            elif itemprop == 'description' and not self.description:
+                self._start_capture('description', tag, attrs)
+            elif tag == 'li' and itemprop == 'recipeIngredient':
+                self._start_capture('ingredient', tag)
+            elif tag == 'li' and itemprop == 'recipeInstructions':
+                self._start_capture('instruction', tag)
+        elif tag == self._capture_tag:
+            self._capture_depth += 1
         
         # Check for recipe schema
-        if 'itemtype' in attrs_dict and 'Recipe' in attrs_dict['itemtype']:
+        if itemtype and 'Recipe' in itemtype:
             self.has_recipe_schema = True
         
         # Check for required properties
-        if 'itemprop' in attrs_dict:
-            prop = attrs_dict['itemprop']
+        if itemprop is not None:
+            prop = itemprop
             
             if prop == 'name':
                 self.has_name = True
@@ -57,6 +593,8 @@ class RecipeSchemaParser(HTMLParser):
                 self.has_yield = True
             elif prop == 'image':
                 self.has_image = True
+                if source:
+                    self.images.append(source.strip())
             elif prop == 'recipeIngredient':
                 if tag == 'li':
                     self.ingredient_count += 1
@@ -77,88 +615,1666 @@ class RecipeSchemaParser(HTMLParser):
     def handle_endtag(self, tag):
         if tag in ['ul', 'ol']:
             self.in_ul_or_ol = False
+        
+        if self._rule_captures:
+            still_open = []
+            for capture in self._rule_captures:
+                if capture[1] == tag:
+                    if not capture[2]:
+                        self._rule_text(capture[0], ''.join(capture[3]))
+                        continue
+                    capture[2] -= 1
+                still_open.append(capture)
+            self._rule_captures = still_open
+        
+        if tag == self._capture_tag:
+            if self._capture_depth:
+                self._capture_depth -= 1
+                return
+            self._end_capture(self._capture, ''.join(self._capture_text))
+            self._capture = None
+            self._capture_tag = None
+    
+    def handle_data(self, data):
+        if self._capture is not None:
+            self._capture_text.append(data)
+        for capture in self._rule_captures:
+            capture[3].append(data)
+    
+    def _rule_text(self, itemprop: str, text: str):
+        text = ' '.join(text.split())
+        for index in self._itemprop_rules[itemprop]:
+            self._rules[index].itemprop_text(self._rule_states[index], itemprop, text)
+    
+    def _start_capture(self, kind: str, tag: str, attrs: List[Tuple[str, Optional[str]]] = ()):
+        if tag in _VOID_TAGS:
+            # No end tag will close it (e.g. <meta itemprop="name" content="...">)
+            self._end_capture(kind, dict(attrs).get('content') or '')
+            return
+        self._capture = kind
+        self._capture_tag = tag
+        self._capture_depth = 0
+        self._capture_text = []
+    
+    def _end_capture(self, kind: str, raw_text: str):
+        text = ' '.join(raw_text.split())
+        if kind == 'json_ld':
+            self.json_ld = json_ld_recipe_fields(raw_text)
+        elif kind == 'title':
+            self.title = text
+        elif kind == 'name':
+            self.recipe_name = text
+        elif kind == 'yield':
+            self.recipe_yield = text
+        elif kind == 'description':
+            self.description = text
+        elif kind == 'ingredient':
+            self.ingredients.append(text)
+        else:
+            self.instructions.append(text)
     
-    def get_validation_result(self) -> Dict[str, any]:
+    def get_validation_result(self) -> RecipeResult:
         """Return validation results"""
+        return RecipeResult(
+            has_schema=self.has_recipe_schema,
+            has_name=self.has_name,
+            has_description=self.has_description,
+            has_yield=self.has_yield,
+            has_image=self.has_image,
+            name=self.recipe_name,
+            title=self.title,
+            recipe_yield=self.recipe_yield,
+            description=self.description,
+            ingredient_count=self.ingredient_count,
+            instruction_count=self.instruction_count,
+            ingredients_on_parent=self.ingredients_on_parent,
+            instructions_on_parent=self.instructions_on_parent,
+            images=self.images,
+            links=self.links,
+            ingredients=self.ingredients,
+            instructions=self.instructions,
+            minhash=minhash_signature(self.ingredients + self.instructions),
+            json_ld=self.json_ld,
+            rule_data={rule.name: rule.end_document(state)
+                       for rule, state in zip(self._rules, self._rule_states)},
+        )
+
+
+def check_file_naming(filename: str) -> Dict[str, List[str]]:
+    """Return the codes of naming errors and warnings for a recipe filename"""
+    verdict = {'errors': [], 'warnings': []}
+    
+    # Check for spaces
+    if ' ' in filename:
+        verdict['errors'].append('name_has_spaces')
+        return verdict
+    
+    # Check for uppercase letters (except .html extension)
+    name_without_ext = filename[:-5]  # Remove .html
+    if name_without_ext != name_without_ext.lower():
+        verdict['errors'].append('name_has_uppercase')
+        return verdict
+    
+    # Check for special characters (allow only letters, numbers, hyphens)
+    if not re.match(r'^[a-z0-9-]+\.html$', filename):
+        verdict['warnings'].append('name_has_special_chars')
+    
+    return verdict
+
+
+# HTML elements without an end tag
+_VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                        'link', 'meta', 'source', 'track', 'wbr'))
+
+
+# JPEG start-of-frame markers, whose segment carries the dimensions
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+_JPEG_STANDALONE_MARKERS = {0x01, *range(0xD0, 0xD9)}
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# File types pages show as images, for mapping changed files back to pages
+_IMAGE_SUFFIXES = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
+
+def read_image_header(path: Path) -> Optional[Dict]:
+    """Format, dimensions and byte size of a JPEG or PNG, from its header only
+    
+    Returns None if the file is neither. JPEG segments before the frame
+    header (EXIF, thumbnails) are skipped with seek() rather than read.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        head = f.read(24)
+        
+        if head.startswith(_PNG_SIGNATURE) and head[12:16] == b'IHDR':
+            width, height = int.from_bytes(head[16:20], 'big'), int.from_bytes(head[20:24], 'big')
+            return {'format': 'PNG', 'width': width, 'height': height, 'bytes': size}
+        
+        if not head.startswith(b'\xff\xd8'):
+            return None
+        f.seek(2)
+        while True:
+            byte = f.read(1)
+            while byte == b'\xff':
+                byte = f.read(1)
+            if not byte:
+                return None
+            marker = byte[0]
+            if marker in _JPEG_STANDALONE_MARKERS:
+                continue
+            length = f.read(2)
+            if len(length) < 2 or marker == 0xDA:
+                # Reached the image data (or the end) without a frame header
+                return None
+            if marker in _JPEG_SOF_MARKERS:
+                frame = f.read(5)
+                if len(frame) < 5:
+                    return None
+                return {
+                    'format': 'JPEG',
+                    'width': int.from_bytes(frame[3:5], 'big'),
+                    'height': int.from_bytes(frame[1:3], 'big'),
+                    'bytes': size,
+                }
+            f.seek(int.from_bytes(length, 'big') - 2, os.SEEK_CUR)
+
+
+def resolve_site_url(source: str, page_folder: Path, github_folder: Path,
+                     site_host: Optional[str] = None) -> Optional[Path]:
+    """Local file a link or image URL points to, or None if hosted elsewhere
+    
+    Relative URLs are resolved against the page's folder. Absolute URLs of this
+    site (https://<site_host>/... or raw.githubusercontent.com/<owner>/<site_host>/<branch>/...)
+    are resolved against the GitHub folder; site_host defaults to its name, as
+    for a <name>.github.io checkout. As in a browser, '..' stops at the site root.
+    """
+    site_host = (site_host or github_folder.name).lower()
+    parsed = urllib.parse.urlsplit(source)
+    parts = urllib.parse.unquote(parsed.path).split('/')
+    if parsed.scheme in ('', 'file') and not parsed.netloc:
+        if not parsed.path.startswith('/'):
+            parts = list(page_folder.relative_to(github_folder).parts) + parts
+    elif parsed.netloc.lower() == 'raw.githubusercontent.com' and len(parts) > 4 \
+            and parts[2].lower() == site_host:
+        parts = parts[4:]
+    elif parsed.netloc.lower() != site_host:
+        return None
+    
+    segments = []
+    for part in parts:
+        if part == '..':
+            if segments:
+                segments.pop()
+        elif part not in ('', '.'):
+            segments.append(part)
+    return github_folder.joinpath(*segments)
+
+
+class RecipeDocument:
+    """A recipe HTML file, read and parsed once per validation run"""
+    
+    def __init__(self, path: Path, content: Optional[str], result: Optional[RecipeResult] = None,
+                 fingerprint: Optional[Tuple[int, int, str]] = None,
+                 naming: Optional[Dict[str, List[str]]] = None):
+        self.path = path
+        self.name = path.name
+        # (mtime_ns, size, sha256) of the file the result was computed from; None for
+        # content that is not on disk (e.g. staged in git), which is never cached
+        self.fingerprint = fingerprint
+        
+        # Without a result, content is parsed here and not kept; checks work from the result
+        if result is None:
+            parser = RecipeSchemaParser()
+            parser.feed_stream([content])
+            result = parser.get_validation_result()
+        self.result = result
+        self.naming = naming if naming is not None else check_file_naming(self.name)
+    
+    @classmethod
+    def from_file(cls, path: Path, wanted: Optional[Set[str]] = None) -> 'RecipeDocument':
+        """Stream and parse a recipe file without holding its text
+        
+        With wanted (a subset of RecipeSchemaParser.PROPERTIES), reading stops
+        once those are found; the partial result has no fingerprint, so it is
+        never cached.
+        """
+        if wanted is not None:
+            parser = RecipeSchemaParser(wanted)
+            parser.feed_stream(iter_file_text(path))
+            return cls(path, None, parser.get_validation_result())
+        
+        stat = path.stat()
+        digest = hashlib.sha256()
+        parser = RecipeSchemaParser()
+        parser.feed_stream(iter_file_text(path, digest=digest))
+        
+        fingerprint = (stat.st_mtime_ns, stat.st_size, digest.hexdigest())
+        return cls(path, None, parser.get_validation_result(), fingerprint)
+    
+    @classmethod
+    def from_bytes(cls, path: Path, data: bytes, stat: os.stat_result) -> 'RecipeDocument':
+        """Parse a recipe file that has already been read into memory"""
+        parser = RecipeSchemaParser()
+        parser.feed_stream([data.decode('utf-8')])
+        fingerprint = (stat.st_mtime_ns, stat.st_size, hashlib.sha256(data).hexdigest())
+        return cls(path, None, parser.get_validation_result(), fingerprint)
+
+
+def write_file_atomic(path: Path, text: str):
+    """Write a text file via a temporary file, so readers never see it half-written
+    
+    Newlines are written as given, so rewritten files keep their line endings.
+    The temporary file has a unique name, so concurrent runs (e.g. --watch and
+    a pre-commit --staged) never write to the same one; the last replace wins.
+    """
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_file = tempfile.mkstemp(prefix=path.name + '.', suffix='.tmp', dir=path.parent)
+    try:
+        with open(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        # mkstemp creates the file private to the user; keep the permissions of the file replaced
+        os.chmod(tmp_file, mode)
+        os.replace(tmp_file, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_file)
+        raise
+
+
+class ValidationCache:
+    """On-disk cache of per-file parse results and project-level findings"""
+    
+    # Bump whenever parse results or check output change shape; parse results
+    # are also discarded when the registered parser rules change
+    VERSION = 11
+    
+    def __init__(self, cache_file: Optional[Path], root: Path):
+        # With no cache_file the cache lives in memory only (used by --watch --no-cache)
+        self.cache_file = cache_file
+        self.root = root
+        self._data = {'version': self.VERSION, 'rules': rule_signature(), 'files': {}, 'projects': {}}
+        # Only rewrite the file when something actually changed
+        self._dirty = False
+        
+        if cache_file is None:
+            return
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == self.VERSION \
+                and data.get('rules') == self._data['rules']:
+            self._data = data
+    
+    def _key(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return path.as_posix()
+    
+    def get_document(self, path: Path) -> Optional[RecipeDocument]:
+        """Return the cached document for an unchanged file, or None"""
+        entry = self._data['files'].get(self._key(path))
+        if entry is None:
+            return None
+        
+        stat = path.stat()
+        if entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            fingerprint = (stat.st_mtime_ns, stat.st_size, entry['sha256'])
+            return RecipeDocument(path, None, RecipeResult.from_json(entry['result']), fingerprint,
+                                  entry['naming'])
+        
+        # Touched but possibly unchanged (e.g. after a checkout): compare content
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+                digest.update(block)
+        if digest.hexdigest() != entry['sha256']:
+            return None
+        fingerprint = (stat.st_mtime_ns, stat.st_size, digest.hexdigest())
+        return RecipeDocument(path, None, RecipeResult.from_json(entry['result']), fingerprint, entry['naming'])
+    
+    def put_document(self, document: RecipeDocument):
+        """Record a document's parse result and naming verdict"""
+        if document.fingerprint is None:
+            return
+        mtime_ns, size, digest = document.fingerprint
+        entry = {
+            'mtime_ns': mtime_ns,
+            'size': size,
+            'sha256': digest,
+            'result': document.result.to_json(),
+            'naming': document.naming,
+        }
+        key = self._key(document.path)
+        if self._data['files'].get(key) != entry:
+            self._data['files'][key] = entry
+            self._dirty = True
+    
+    def prune(self, folder: Path, paths: List[Path]):
+        """Forget cached files in a folder that are no longer present"""
+        prefix = self._key(folder) + '/'
+        keep = {self._key(path) for path in paths}
+        files = self._data['files']
+        for key in [key for key in files if key.startswith(prefix) and key not in keep]:
+            del files[key]
+            self._dirty = True
+    
+    def get_project(self, project_name: str, fingerprint: str) -> Optional[Dict]:
+        """Return cached project-level findings if their inputs are unchanged"""
+        entry = self._data['projects'].get(project_name)
+        if entry is not None and entry['fingerprint'] == fingerprint:
+            return entry
+        return None
+    
+    def put_project(self, project_name: str, fingerprint: str, findings: Dict):
+        """Record project-level findings for a set of inputs"""
+        self._data['projects'][project_name] = {'fingerprint': fingerprint, **findings}
+        self._dirty = True
+    
+    def save(self):
+        """Write the cache atomically, if it changed"""
+        if self.cache_file is None or not self._dirty:
+            return
+        write_file_atomic(self.cache_file, json.dumps(self._data, ensure_ascii=False, separators=(',', ':')))
+        self._dirty = False
+
+
+class RecipeDocumentStore:
+    """Per-run cache so every check shares one read and parse of each file"""
+    
+    def __init__(self, cache: Optional[ValidationCache] = None):
+        self.cache = cache
+        # Work done since the last reset_counters()
+        self.files_parsed = 0
+        self.cache_hits = 0
+        self.bytes_read = 0
+        self._documents: Dict[Path, RecipeDocument] = {}
+    
+    def get(self, path: Path) -> RecipeDocument:
+        """Return the document for a path, reading it on first access only"""
+        document = self._documents.get(path)
+        if document is not None:
+            return document
+        
+        document = self._from_cache(path)
+        if document is None:
+            document = RecipeDocument.from_file(path)
+            self.add(document, parsed=True, bytes_read=document.fingerprint[1])
+        else:
+            self.add(document)
+        return document
+    
+    def add(self, document: RecipeDocument, parsed: bool = False, bytes_read: int = 0):
+        """Seed the store with a document parsed elsewhere"""
+        self._documents[document.path] = document
+        if parsed:
+            self.files_parsed += 1
+        self.bytes_read += bytes_read
+        if self.cache is not None:
+            self.cache.put_document(document)
+    
+    def load(self, paths: List[Path]) -> List[RecipeDocument]:
+        """Return documents for all paths, in order"""
+        return [self.get(path) for path in paths]
+    
+    def load_names(self, paths: List[Path]) -> List[RecipeDocument]:
+        """Documents good for their name and title only, in order
+        
+        Files not already loaded or cached are read only up to their
+        itemprop="name" and <title>. Those partial documents are not stored,
+        so a later get() still parses the whole file.
+        """
+        documents = []
+        for path in paths:
+            document = self._documents.get(path) or self._from_cache(path)
+            if document is None:
+                document = RecipeDocument.from_file(path, wanted={'name', 'title'})
+                self.files_parsed += 1
+            else:
+                self._documents[path] = document
+            documents.append(document)
+        return documents
+    
+    def load_cached(self, paths: List[Path]) -> List[Path]:
+        """Load cache hits into the store and return the paths still to parse"""
+        missing = []
+        for path in paths:
+            if path in self._documents:
+                continue
+            document = self._from_cache(path)
+            if document is None:
+                missing.append(path)
+            else:
+                self.add(document)
+        return missing
+    
+    def prefetch(self, paths: List[Path], pool: ThreadPoolExecutor, window: int) -> float:
+        """Look up and read files on a thread pool, parsing each as its read completes
+        
+        At most window reads are in flight, so slow opens overlap instead of
+        adding up while only window files are held in memory unparsed.
+        Returns the seconds spent parsing, in between waiting for reads.
+        """
+        parse_seconds = 0.0
+        in_flight = deque()
+        for path in paths:
+            if path in self._documents:
+                continue
+            if len(in_flight) >= window:
+                parse_seconds += self._add_fetched(*in_flight.popleft().result())
+            in_flight.append(pool.submit(self._fetch, path))
+        while in_flight:
+            parse_seconds += self._add_fetched(*in_flight.popleft().result())
+        return parse_seconds
+    
+    def _add_fetched(self, path: Path, document: Optional[RecipeDocument],
+                     stat: Optional[os.stat_result], data: Optional[bytes]):
+        """Store the result of _fetch(), parsing it if it was read from disk; returns the parse time"""
+        started = time.perf_counter()
+        if document is not None:
+            self.cache_hits += 1
+            self.add(document)
+        else:
+            self.add(RecipeDocument.from_bytes(path, data, stat), parsed=True, bytes_read=len(data))
+        return time.perf_counter() - started
+    
+    def _fetch(self, path: Path) -> Tuple[Path, Optional[RecipeDocument], Optional[os.stat_result], Optional[bytes]]:
+        """Cache lookup or raw read of one file (runs on a prefetch thread)"""
+        if self.cache is not None:
+            document = self.cache.get_document(path)
+            if document is not None:
+                return path, document, None, None
+        stat = path.stat()
+        return path, None, stat, path.read_bytes()
+    
+    def invalidate(self, path: Path):
+        """Drop a cached document so the next access re-reads it"""
+        self._documents.pop(path, None)
+    
+    def reset_counters(self):
+        """Start counting parsed files afresh"""
+        self.files_parsed = 0
+        self.cache_hits = 0
+        self.bytes_read = 0
+    
+    def counters(self) -> Dict[str, int]:
+        """Snapshot of the work counters"""
         return {
-            'has_schema': self.has_recipe_schema,
-            'has_name': self.has_name,
-            'has_description': self.has_description,
-            'has_yield': self.has_yield,
-            'has_image': self.has_image,
-            'ingredient_count': self.ingredient_count,
-            'instruction_count': self.instruction_count,
-            'schema_errors': {
-                'ingredients_on_parent': self.ingredients_on_parent,
-                'instructions_on_parent': self.instructions_on_parent,
-            }
+            'files_parsed': self.files_parsed,
+            'cache_hits': self.cache_hits,
+            'bytes_read': self.bytes_read,
         }
+    
+    def _from_cache(self, path: Path) -> Optional[RecipeDocument]:
+        if self.cache is None:
+            return None
+        document = self.cache.get_document(path)
+        if document is not None:
+            self.cache_hits += 1
+        return document
 
 
-class RecipeProjectValidator:
+class PhaseTimings:
+    """Wall time, files, bytes read and cache hits recorded per validation phase"""
+    
+    def __init__(self, documents: RecipeDocumentStore):
+        self.documents = documents
+        self.phases: List[Dict] = []
+        self._current: Optional[Dict] = None
+    
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """Record one phase; document store activity inside it is attributed to it"""
+        record = {
+            'name': name,
+            'start_us': time.perf_counter_ns() // 1000,
+            'seconds': 0.0,
+            'files': 0,
+            'bytes_read': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+        }
+        before = self.documents.counters()
+        outer, self._current = self._current, record
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - started
+            after = self.documents.counters()
+            record['bytes_read'] += after['bytes_read'] - before['bytes_read']
+            record['cache_hits'] += after['cache_hits'] - before['cache_hits']
+            if self.documents.cache is not None:
+                record['cache_misses'] += after['files_parsed'] - before['files_parsed']
+            self._current = outer
+            self.phases.append(record)
+    
+    def split(self, record: Dict, name: str, seconds: float):
+        """Move seconds of a finished phase into a new phase recorded right after it"""
+        seconds = min(seconds, record['seconds'])
+        record['seconds'] -= seconds
+        self.phases.append({
+            'name': name,
+            'start_us': record['start_us'] + int(record['seconds'] * 1_000_000),
+            'seconds': seconds,
+            'files': 0,
+            'bytes_read': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+        })
+    
+    def add(self, files: int = 0, bytes_read: int = 0):
+        """Count work done outside the document store against the current phase"""
+        if self._current is not None:
+            self._current['files'] += files
+            self._current['bytes_read'] += bytes_read
+    
+    def print_table(self, title: str = "PHASE TIMINGS"):
+        """Print a table of the recorded phases"""
+        print(f"⏱️  {title}:")
+        print(f"  {'Phase':<22} {'Time (ms)':>10} {'Files':>8} {'Bytes read':>12} {'Cache hits':>11}")
+        print("  " + "-" * 67)
+        for record in self.phases:
+            lookups = record['cache_hits'] + record['cache_misses']
+            hit_rate = f"{record['cache_hits'] / lookups:.0%}" if lookups else "-"
+            print(f"  {record['name']:<22} {record['seconds'] * 1000:>10.1f} {record['files']:>8} "
+                  f"{record['bytes_read']:>12,} {hit_rate:>11}")
+        total = sum(record['seconds'] for record in self.phases)
+        print(f"  {'total':<22} {total * 1000:>10.1f}")
+        print()
+    
+    def trace_events(self, tid: int = 0, label: str = '') -> List[Dict]:
+        """Phases as Chrome trace-event 'complete' events"""
+        events = []
+        for record in self.phases:
+            args = {key: record[key] for key in ('files', 'bytes_read', 'cache_hits', 'cache_misses')}
+            if label:
+                args['project'] = label
+            events.append({
+                'name': record['name'],
+                'cat': 'validation',
+                'ph': 'X',
+                'ts': record['start_us'],
+                'dur': int(record['seconds'] * 1_000_000),
+                'pid': os.getpid(),
+                'tid': tid,
+                'args': args,
+            })
+        return events
+
+
+def write_trace(validators: List['RecipeProjectValidator'], trace_file: str):
+    """Write every validator's phases to a Chrome trace-event JSON file"""
+    events = []
+    for tid, validator in enumerate(validators):
+        events.append({'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid,
+                       'args': {'name': validator.project_name}})
+        events.extend(validator.timings.trace_events(tid, validator.project_name))
+    with open(trace_file, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+def normalize_recipe_name(name: str) -> str:
+    """Normalize a recipe name for matching (case, accents, punctuation)"""
+    stripped = name
+    if not name.isascii():
+        decomposed = unicodedata.normalize('NFKD', name)
+        stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    stripped = re.sub(r"['\u2018\u2019`]", '', stripped.lower()).replace('&', ' and ')
+    return ' '.join(re.findall(r'[a-z0-9]+', stripped))
+
+
+def _trigrams(key: str) -> Set[str]:
+    """Character trigrams of a normalized name, padded at the word edges"""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# MinHash signatures for near-duplicate detection: word shingles are hashed
+# once and spread over MINHASH_BANDS * MINHASH_ROWS bins (one-permutation hashing)
+MINHASH_SHINGLE_WORDS = 3
+MINHASH_BANDS = 16
+MINHASH_ROWS = 4
+MINHASH_BINS = MINHASH_BANDS * MINHASH_ROWS
+_MINHASH_VALUE_BITS = 32
+_MINHASH_HASH_MASK = (1 << _MINHASH_VALUE_BITS) - 1
+_MINHASH_MULTIPLIER = 0x9E3779B1
+_WORD_PATTERN = re.compile(r'[^\W_]+')
+# Fixed pseudo-random order in which each empty bin looks for a filled one to
+# borrow from; probing (rather than taking the next bin) keeps the bins of a
+# band independent when several in a row are empty
+_MINHASH_PROBES = [random.Random(slot).sample(range(MINHASH_BINS), MINHASH_BINS)
+                   for slot in range(MINHASH_BINS)]
+
+
+def minhash_signature(texts: List[str]) -> Optional[List[int]]:
+    """MinHash signature of the word shingles of some text; None if there are none
+    
+    Each shingle is hashed once; the low bits pick a bin and the rest is the
+    value, keeping the minimum per bin. Empty bins borrow the value of the
+    first filled bin in their probe order, tagged with the probe step, so
+    short texts still compare.
+    """
+    # Both copies of a duplicate share their accents, so unlike title
+    # matching there is no need for the slower normalize_recipe_name()
+    words = _WORD_PATTERN.findall(' '.join(texts).lower())
+    if not words:
+        return None
+    
+    size = MINHASH_SHINGLE_WORDS
+    shingles = {' '.join(words[i:i + size]) for i in range(max(len(words) - size + 1, 1))}
+    bins: List[Optional[int]] = [None] * MINHASH_BINS
+    for shingle in shingles:
+        # CRC-32 is stable across processes (unlike hash()) and much cheaper than
+        # a cryptographic digest; the multiply spreads its bits over the slots
+        hashed = zlib.crc32(shingle.encode('utf-8')) * _MINHASH_MULTIPLIER & _MINHASH_HASH_MASK
+        slot = hashed % MINHASH_BINS
+        value = hashed // MINHASH_BINS
+        current = bins[slot]
+        if current is None or value < current:
+            bins[slot] = value
+    
+    signature = list(bins)
+    for slot in range(MINHASH_BINS):
+        if signature[slot] is not None:
+            continue
+        for step, probe in enumerate(_MINHASH_PROBES[slot], 1):
+            if bins[probe] is not None:
+                signature[slot] = bins[probe] + (step << _MINHASH_VALUE_BITS)
+                break
+    return signature
+
+
+def find_near_duplicates(documents: List[RecipeDocument], threshold: float) -> List[Tuple[RecipeDocument, RecipeDocument, float]]:
+    """Pairs of documents whose ingredient and instruction text look alike
+    
+    Signatures are split into bands and only documents sharing a whole band
+    are compared (locality-sensitive hashing), so the cost grows with the
+    number of documents rather than the number of pairs. The similarity is
+    the fraction of matching signature bins, an estimate of the Jaccard
+    similarity of the two shingle sets.
+    """
+    buckets: Dict[Tuple, List[int]] = defaultdict(list)
+    signed = [document for document in documents if document.result.minhash is not None]
+    for doc_id, document in enumerate(signed):
+        signature = document.result.minhash
+        for band in range(MINHASH_BANDS):
+            start = band * MINHASH_ROWS
+            buckets[(band, *signature[start:start + MINHASH_ROWS])].append(doc_id)
+    
+    candidates = set()
+    for doc_ids in buckets.values():
+        for i, first in enumerate(doc_ids):
+            for second in doc_ids[i + 1:]:
+                candidates.add((first, second))
+    
+    duplicates = []
+    for first, second in candidates:
+        a, b = signed[first].result.minhash, signed[second].result.minhash
+        similarity = sum(x == y for x, y in zip(a, b)) / MINHASH_BINS
+        if similarity >= threshold:
+            duplicates.append((signed[first], signed[second], similarity))
+    duplicates.sort(key=lambda pair: (-pair[2], pair[0].name, pair[1].name))
+    return duplicates
+
+
+def name_similarity(first: str, second: str) -> float:
+    """Dice similarity of the trigram sets of two normalized names"""
+    first_grams = _trigrams(normalize_recipe_name(first))
+    second_grams = _trigrams(normalize_recipe_name(second))
+    return 2 * len(first_grams & second_grams) / (len(first_grams) + len(second_grams))
+
+
+def _display_name(document: RecipeDocument) -> str:
+    """Name a recipe is listed under: its itemprop="name", else its <title>"""
+    return document.result.name or document.result.title
+
+
+def index_link_pattern(project_name: str) -> str:
+    """Regex for an index link to a page of project_name, shared by the checks and --fix
+    
+    Groups: attributes before href, filename, attributes after href, display name.
+    Extra attributes such as class="light-blue" are allowed on either side.
+    """
+    return rf'<a([^>]*?)\s+href="{re.escape(project_name)}/([^"]+)"([^>]*)>([^<]+)</a>'
+
+
+class RecipeTitleIndex:
+    """Lookup of recipe documents by normalized name/title, with a fuzzy fallback"""
+    
+    # Minimum Dice similarity of trigram sets for a near-miss to count as a match
+    FUZZY_THRESHOLD = 0.8
+    # Candidates come from the postings of this many of the query's rarest trigrams,
+    # and only the ones sharing most of those trigrams are scored
+    FUZZY_PROBE_GRAMS = 8
+    FUZZY_CANDIDATES = 16
+    
+    def __init__(self, documents: List[RecipeDocument]):
+        self._exact: Dict[str, RecipeDocument] = {}
+        self._keys: List[str] = []
+        self._grams: List[Set[str]] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        
+        for document in documents:
+            for value in (document.result.name, document.result.title):
+                key = normalize_recipe_name(value)
+                if not key or key in self._exact:
+                    continue
+                self._exact[key] = document
+                key_id = len(self._keys)
+                self._keys.append(key)
+                grams = _trigrams(key)
+                self._grams.append(grams)
+                for gram in grams:
+                    self._postings[gram].append(key_id)
+    
+    def match(self, name: str) -> Tuple[Optional[RecipeDocument], float]:
+        """Return the best matching document and its similarity (1.0 for exact)"""
+        key = normalize_recipe_name(name)
+        document = self._exact.get(key)
+        if document is not None:
+            return document, 1.0
+        
+        grams = _trigrams(key)
+        
+        # Near-misses (accents, apostrophes, a typo) keep most of their rare
+        # grams, so only keys sharing one of the rarest are scored; common
+        # grams like " wi" would otherwise pull in the whole index
+        rarest = sorted(grams, key=lambda gram: len(self._postings.get(gram, ())))
+        shared = defaultdict(int)
+        for gram in rarest[:self.FUZZY_PROBE_GRAMS]:
+            for key_id in self._postings.get(gram, ()):
+                shared[key_id] += 1
+        candidates = heapq.nlargest(self.FUZZY_CANDIDATES, shared, key=shared.__getitem__)
+        
+        best_id, best_score = None, 0.0
+        for key_id in candidates:
+            other = self._grams[key_id]
+            score = 2 * len(grams & other) / (len(grams) + len(other))
+            if score > best_score:
+                best_id, best_score = key_id, score
+        
+        if best_id is None or best_score < self.FUZZY_THRESHOLD:
+            return None, best_score
+        return self._exact[self._keys[best_id]], best_score
+
+
+# Bump whenever the search artifact's format or tokenization changes
+SEARCH_INDEX_VERSION = 1
+
+
+def _search_tokens(text: str) -> Set[str]:
+    """Words of a name or ingredient line, normalized as for title matching
+    
+    The site tokenizes queries the same way: lowercase, accents stripped,
+    runs of [a-z0-9]; single characters and bare numbers are dropped.
+    """
+    return {token for token in normalize_recipe_name(text).split()
+            if len(token) > 1 and not token.isdigit()}
+
+
+def _delta_encode(ids: array) -> List[int]:
+    """Sorted ids as the first id followed by the gaps between neighbours"""
+    return [ids[0]] + [ids[i] - ids[i - 1] for i in range(1, len(ids))]
+
+
+def search_index_source(documents: List[RecipeDocument]) -> str:
+    """Hash of the file contents a search index is built from"""
+    digest = hashlib.sha256(f"{SEARCH_INDEX_VERSION}\0".encode('utf-8'))
+    for document in sorted(documents, key=lambda d: d.name):
+        digest.update(f"{document.name}\0{document.fingerprint[2]}\0".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def build_search_index(project_name: str, documents: List[RecipeDocument]) -> Dict:
+    """Inverted index from name/ingredient tokens to recipe ids
+    
+    Recipe ids are positions in the 'recipes' list (sorted by filename), and
+    each token's postings are delta-encoded so the file stays small.
+    """
+    documents = sorted(documents, key=lambda d: d.name)
+    postings: Dict[str, array] = defaultdict(lambda: array('I'))
+    recipes = []
+    
+    for recipe_id, document in enumerate(documents):
+        result = document.result
+        name = result.name or result.title
+        recipes.append([document.name, name])
+        tokens = _search_tokens(name)
+        for ingredient in result.ingredients:
+            tokens |= _search_tokens(ingredient)
+        for token in tokens:
+            postings[token].append(recipe_id)
+    
+    return {
+        'version': SEARCH_INDEX_VERSION,
+        'project': project_name,
+        'source': search_index_source(documents),
+        'recipes': recipes,
+        'tokens': {token: _delta_encode(ids) for token, ids in sorted(postings.items())},
+    }
+
+
+# Unicode fractions used in quantities, as in "1¾ pounds"
+_FRACTIONS = {
+    '½': 1 / 2, '⅓': 1 / 3, '⅔': 2 / 3, '¼': 1 / 4, '¾': 3 / 4, '⅕': 1 / 5, '⅖': 2 / 5, '⅗': 3 / 5,
+    '⅘': 4 / 5, '⅙': 1 / 6, '⅚': 5 / 6, '⅛': 1 / 8, '⅜': 3 / 8, '⅝': 5 / 8, '⅞': 7 / 8,
+}
+_FRACTION_CHARS = ''.join(_FRACTIONS)
+_NUMBER = rf'\d+\s+\d+/\d+|\d+/\d+|\d+(?:\.\d+)?(?:\s*[{_FRACTION_CHARS}])?|[{_FRACTION_CHARS}]'
+
+# Leading amount, optionally a range, as in "About 1 to 2" or "Serves 4"
+_QUANTITY = re.compile(
+    rf'\s*(?:(?:makes|serves|yields?)\s+)?(?:about\s+)?({_NUMBER})(?:\s*(?:to|or|-|–)\s*({_NUMBER}))?',
+    re.IGNORECASE)
+# Word after the amount, skipping a size ("1 small clove")
+_UNIT_WORD = re.compile(r'\s*(?:(?:small|medium|large)\s+)?([a-z]+)\.?(?![\w-])', re.IGNORECASE)
+# Parenthetical right after the unit, and a metric amount within it ("(about 4 oz/57 g)")
+_PARENTHETICAL = re.compile(r'\s*\(([^()]*)\)')
+_METRIC_AMOUNT = re.compile(rf'({_NUMBER})\s*(kg|g|ml|l)\b', re.IGNORECASE)
+# Metric amount after a slash right after the unit ("4 oz/113 g butter")
+_SLASH_METRIC = re.compile(rf'\s*/\s*({_NUMBER})\s*(kg|g|ml|l)\b', re.IGNORECASE)
+_ANY_PARENTHETICAL = re.compile(r'\s*\([^()]*\)')
+
+# Unit spelling -> (canonical unit, grams or millilitres per unit, 'g' or 'ml');
+# counted units (cloves, sprigs, ...) have no fixed weight or volume
+_UNITS: Dict[str, Tuple[str, Optional[float], Optional[str]]] = {}
+for _names, _unit, _factor, _measure in (
+    (('g', 'gram', 'grams'), 'g', 1.0, 'g'),
+    (('kg', 'kilogram', 'kilograms'), 'kg', 1000.0, 'g'),
+    (('oz', 'ounce', 'ounces'), 'oz', 28.3495, 'g'),
+    (('lb', 'lbs', 'pound', 'pounds'), 'lb', 453.592, 'g'),
+    (('stick', 'sticks'), 'stick', 113.4, 'g'),
+    (('ml', 'milliliter', 'milliliters', 'millilitre', 'millilitres'), 'ml', 1.0, 'ml'),
+    (('l', 'liter', 'liters', 'litre', 'litres'), 'l', 1000.0, 'ml'),
+    (('tsp', 'teaspoon', 'teaspoons'), 'tsp', 4.92892, 'ml'),
+    (('tbsp', 'tablespoon', 'tablespoons'), 'tbsp', 14.7868, 'ml'),
+    (('cup', 'cups'), 'cup', 236.588, 'ml'),
+    (('pint', 'pints'), 'pint', 473.176, 'ml'),
+    (('quart', 'quarts'), 'quart', 946.353, 'ml'),
+    (('gallon', 'gallons'), 'gallon', 3785.41, 'ml'),
+    (('clove', 'cloves'), 'clove', None, None),
+    (('sprig', 'sprigs'), 'sprig', None, None),
+    (('bunch', 'bunches'), 'bunch', None, None),
+    (('pinch', 'pinches'), 'pinch', None, None),
+    (('slice', 'slices'), 'slice', None, None),
+    (('piece', 'pieces'), 'piece', None, None),
+    (('head', 'heads'), 'head', None, None),
+    (('ear', 'ears'), 'ear', None, None),
+    (('can', 'cans'), 'can', None, None),
+):
+    for _name in _names:
+        _UNITS[_name] = (_unit, _factor, _measure)
+
+
+def _quantity_value(number: str) -> Optional[float]:
+    """Value of a number matched by _NUMBER, such as 2, 1.5, 1 1/2, 1/2, 1¾ or ¾
+    
+    None for a fraction with a zero denominator ("1/0").
+    """
+    number = number.strip()
+    if number[-1] in _FRACTIONS:
+        whole = number[:-1].strip()
+        return (float(whole) if whole else 0.0) + _FRACTIONS[number[-1]]
+    if '/' in number:
+        whole, _, fraction = number.rpartition(' ')
+        numerator, denominator = fraction.split('/')
+        if int(denominator) == 0:
+            return None
+        return (float(whole) if whole else 0.0) + int(numerator) / int(denominator)
+    return float(number)
+
+
+def parse_quantity(text: str) -> Dict:
+    """Split an ingredient or yield line into amount, unit and item
+    
+    quantity is the amount (the low end of a range, whose high end is
+    quantity_max) or None, unit the canonical unit or '' and item what is
+    left once parentheticals and notes after the first comma are dropped.
+    grams and ml (of quantity) are filled in when it has a known weight or
+    volume; a metric amount in parentheses ("8 ounces (227 g)") or after a
+    slash ("4 oz/113 g") is used as given rather than converted, and then
+    fills only its own column. An amount that is not a number ("1/0") counts
+    as no quantity.
+    """
+    amount = {'quantity': None, 'quantity_max': None, 'unit': '', 'grams': None, 'ml': None, 'item': ''}
+    rest = text
+    
+    match = _QUANTITY.match(text)
+    if match and _quantity_value(match.group(1)) is not None:
+        amount['quantity'] = _quantity_value(match.group(1))
+        if match.group(2):
+            amount['quantity_max'] = _quantity_value(match.group(2))
+        rest = text[match.end():]
+        
+        unit_match = _UNIT_WORD.match(rest)
+        unit = unit_match and _UNITS.get(unit_match.group(1).lower())
+        if unit:
+            amount['unit'], factor, measure = unit
+            if factor is not None:
+                amount['grams' if measure == 'g' else 'ml'] = amount['quantity'] * factor
+            rest = rest[unit_match.end():]
+            
+            metric = None
+            paren_match = _PARENTHETICAL.match(rest)
+            slash_match = _SLASH_METRIC.match(rest)
+            if paren_match:
+                found = _METRIC_AMOUNT.findall(paren_match.group(1))
+                metric = found[-1] if found else None
+                rest = rest[paren_match.end():]
+            elif slash_match:
+                metric = slash_match.groups()
+                rest = rest[slash_match.end():]
+            
+            if metric and _quantity_value(metric[0]) is not None:
+                factor, measure = _UNITS[metric[1].lower()][1:]
+                amount['grams'] = amount['ml'] = None
+                amount['grams' if measure == 'g' else 'ml'] = _quantity_value(metric[0]) * factor
+    
+    item = _ANY_PARENTHETICAL.sub('', rest.split(',', 1)[0]).strip()
+    if item.lower().startswith('of '):
+        item = item[3:]
+    amount['item'] = item
+    return amount
+
+
+# Columns of the ingredient table, one row per ingredient line; yield_unit is
+# what the yield counts ("servings") when it has no unit
+INGREDIENT_TABLE_COLUMNS = ('recipe', 'line', 'quantity', 'quantity_max', 'unit', 'grams', 'ml', 'item',
+                            'yield_quantity', 'yield_unit', 'text')
+
+
+def _table_number(value: Optional[float], digits: int) -> str:
+    return '' if value is None else format(round(value, digits), 'g')
+
+
+def build_ingredient_table(documents: List[RecipeDocument]) -> str:
+    """CSV of every ingredient line with its parsed amount, recipes sorted by filename"""
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(INGREDIENT_TABLE_COLUMNS)
+    
+    for document in sorted(documents, key=lambda d: d.name):
+        result = document.result
+        recipe_yield = parse_quantity(result.recipe_yield)
+        yield_unit = recipe_yield['unit'] or recipe_yield['item']
+        for line, text in enumerate(result.ingredients, 1):
+            amount = parse_quantity(text)
+            writer.writerow((
+                document.name, line,
+                _table_number(amount['quantity'], 3), _table_number(amount['quantity_max'], 3), amount['unit'],
+                _table_number(amount['grams'], 1), _table_number(amount['ml'], 1), amount['item'],
+                _table_number(recipe_yield['quantity'], 3), yield_unit, text,
+            ))
+    return out.getvalue()
+
+
+# Recipe properties carried over between microdata and JSON-LD
+JSON_LD_FIELDS = ('name', 'description', 'recipeYield', 'image', 'recipeIngredient', 'recipeInstructions')
+
+# A JSON-LD script element, with the whitespace around it
+_JSON_LD_SCRIPT = re.compile(r'[ \t]*<script\b[^>]*ld\+json[^>]*>(.*?)</script>[ \t]*(?:\r?\n)?',
+                             re.IGNORECASE | re.DOTALL)
+_HEAD_END = re.compile(r'^([ \t]*)</head>', re.IGNORECASE | re.MULTILINE)
+
+
+def _json_ld_texts(value) -> List[str]:
+    """Whitespace-normalized strings of a JSON-LD value: a string, a list, or
+    objects carrying text/url/itemListElement (HowToStep, HowToSection, ImageObject)"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [' '.join(value.split())]
+    if isinstance(value, list):
+        return [text for item in value for text in _json_ld_texts(item)]
+    if isinstance(value, dict):
+        for key in ('text', 'url', 'itemListElement'):
+            if key in value:
+                return _json_ld_texts(value[key])
+        return []
+    return [str(value)]
+
+
+def _json_ld_find_recipe(data) -> Optional[Dict]:
+    """First object of @type Recipe in a JSON-LD document (top level, a list or an @graph)"""
+    if isinstance(data, list):
+        for item in data:
+            recipe = _json_ld_find_recipe(item)
+            if recipe is not None:
+                return recipe
+        return None
+    if not isinstance(data, dict):
+        return None
+    types = data.get('@type')
+    if types == 'Recipe' or (isinstance(types, list) and 'Recipe' in types):
+        return data
+    return _json_ld_find_recipe(data.get('@graph'))
+
+
+def json_ld_recipe_fields(text: str) -> Optional[Dict]:
+    """The Recipe in a JSON-LD script, reduced to JSON_LD_FIELDS as microdata_recipe_fields() does
+    
+    Returns None if the script holds no Recipe, and {'@error': reason} if it
+    is not valid JSON.
+    """
+    try:
+        recipe = _json_ld_find_recipe(json.loads(text))
+    except ValueError as e:
+        return {'@error': str(e)}
+    if recipe is None:
+        return None
+    fields = {}
+    for field in JSON_LD_FIELDS:
+        texts = _json_ld_texts(recipe.get(field))
+        if field in ('image', 'recipeIngredient', 'recipeInstructions'):
+            fields[field] = texts
+        else:
+            fields[field] = texts[0] if texts else ''
+    return fields
+
+
+def microdata_recipe_fields(result: RecipeResult) -> Dict:
+    """The page's microdata recipe properties, keyed like JSON-LD"""
+    return {
+        'name': result.name,
+        'description': result.description,
+        'recipeYield': result.recipe_yield,
+        'image': result.images,
+        'recipeIngredient': result.ingredients,
+        'recipeInstructions': result.instructions,
+    }
+
+
+def recipe_json_ld(result: RecipeResult, url: Optional[str] = None) -> Dict:
+    """A schema.org Recipe object holding the page's microdata"""
+    recipe = {'@type': 'Recipe'}
+    if url is not None:
+        recipe['url'] = url
+    recipe.update({
+        'name': result.name,
+        'description': result.description,
+        'recipeYield': result.recipe_yield,
+        'image': result.images[0] if len(result.images) == 1 else result.images,
+        'recipeIngredient': result.ingredients,
+        'recipeInstructions': [{'@type': 'HowToStep', 'text': text} for text in result.instructions],
+    })
+    return recipe
+
+
+def json_ld_script(result: RecipeResult, indent: str, newline: str) -> str:
+    """<script type="application/ld+json"> element for a page, one line per JSON line"""
+    data = {'@context': 'https://schema.org', **recipe_json_ld(result)}
+    # "</" would end the script element early
+    body = json.dumps(data, ensure_ascii=False, indent=2).replace('</', '<\\/')
+    lines = [f'{indent}<script type="application/ld+json">']
+    lines += [indent + line for line in body.split('\n')]
+    lines.append(f'{indent}</script>')
+    return newline.join(lines) + newline
+
+
+def build_json_ld_export(documents: List[RecipeDocument]) -> Dict:
+    """JSON-LD graph of every page with a Recipe schema, sorted by filename"""
+    return {
+        '@context': 'https://schema.org',
+        '@graph': [recipe_json_ld(document.result, document.name)
+                   for document in sorted(documents, key=lambda d: d.name) if document.result.has_schema],
+    }
+
+
+class FindingRecorder:
+    """Finding bookkeeping shared by RecipeProjectValidator and SiteLinkChecker
+    
+    Subclasses set project_name, finding_sink and retain_findings, and call
+    reset_findings() before each run.
+    """
+    
+    def reset_findings(self):
+        # Every finding when retain_findings is set, for the text report
+        self.findings: List[Finding] = []
+        self.finding_counts = {'error': 0, 'warning': 0}
+    
+    def _record(self, finding: Finding):
+        """Count a finding, hand it to the finding sink, and keep it if asked to"""
+        self.finding_counts[finding.severity] += 1
+        if self.finding_sink is not None:
+            self.finding_sink(finding)
+        if self.retain_findings:
+            self.findings.append(finding)
+    
+    def _error(self, category: str, code: str, *args, file: Optional[str] = None):
+        self._record(Finding(self.project_name, 'error', category, code, args, file))
+    
+    def _warning(self, category: str, code: str, *args, file: Optional[str] = None):
+        self._record(Finding(self.project_name, 'warning', category, code, args, file))
+    
+    @property
+    def errors(self) -> Dict[str, List]:
+        """Messages of the retained errors, by category"""
+        return _messages_by_category(self.findings, 'error')
+    
+    @property
+    def warnings(self) -> Dict[str, List]:
+        """Messages of the retained warnings, by category"""
+        return _messages_by_category(self.findings, 'warning')
+
+
+class RecipeProjectValidator(FindingRecorder):
     """Main validator for recipe HTML projects"""
     
-    def __init__(self, github_folder: str, project_name: str):
+    # Error/warning categories produced by project-level (cacheable) checks
+    PROJECT_CHECK_CATEGORIES = ('cross_reference', 'alphabetical')
+    
+    # Minimum estimated ingredient/instruction similarity for a duplicate. Variants
+    # in one family (the flavoured doughs, the stocks) are as alike as that, so
+    # the recipe names must also match as closely as a fuzzy title match
+    DUPLICATE_TEXT_THRESHOLD = 0.8
+    
+    # Limits for images served on recipe pages: size on disk, longest side, and
+    # JPEG bytes per pixel (photos saved at print quality or carrying large
+    # metadata are well above it)
+    IMAGE_MAX_BYTES = 500 * 1024
+    IMAGE_MAX_DIMENSION = 2000
+    IMAGE_MAX_JPEG_BYTES_PER_PIXEL = 0.5
+    
+    def __init__(self, github_folder: str, project_name: str, cache: Optional[ValidationCache] = None,
+                 finding_sink: Optional[Callable[[Finding], None]] = None, retain_findings: bool = True,
+                 prefetch_concurrency: int = 0, search_index: bool = False, ingredient_table: bool = False,
+                 json_ld: Optional[str] = None, site_host: Optional[str] = None):
         self.github_folder = Path(github_folder)
         self.project_name = project_name
+        # Host absolute URLs of this site use (default: the GitHub folder's name)
+        self.site_host = site_host
         self.recipe_folder = self.github_folder / project_name
         
-        # Find index file (lowercase project name with hyphens)
-        index_name = project_name.lower().replace(' ', '-') + '.html'
-        self.index_file = self.github_folder / index_name
+        # Find index file (lowercase project name with hyphens)
+        index_name = project_name.lower().replace(' ', '-') + '.html'
+        self.index_file = self.github_folder / index_name
+        
+        self.inventory_file = self.recipe_folder / 'recipe-inventory.md'
+        
+        # Static search artifact for the site, written next to the index when search_index is set
+        self.search_index = search_index
+        self.search_index_file = self.index_file.with_name(self.index_file.stem + '-search.json')
+        
+        # Parsed ingredient amounts, written next to the inventory when ingredient_table is set
+        self.ingredient_table = ingredient_table
+        self.ingredient_table_file = self.recipe_folder / 'recipe-ingredients.csv'
+        
+        # 'export' writes every page's JSON-LD to json_ld_file; 'inject' writes it into
+        # the pages themselves, before they are checked
+        self.json_ld = json_ld
+        self.json_ld_file = self.recipe_folder / 'recipes.jsonld'
+        
+        # Every recipe file is read and parsed once, then shared by all checks;
+        # with a cache, unchanged files are not read at all
+        self.cache = cache
+        self.documents = RecipeDocumentStore(cache)
+        
+        # Each finding is passed to finding_sink as soon as it is produced; with
+        # retain_findings=False only project-level ones are kept, for the cache
+        self.finding_sink = finding_sink
+        self.retain_findings = retain_findings
+        
+        # With prefetch_concurrency > 0, files are read on that many threads and parsed
+        # as each read completes, before the checks run
+        self.prefetch_concurrency = prefetch_concurrency
+        
+        # Set by limit_to_changes(): only changed_files get per-file checks,
+        # project-level checks run only if project_changed, and the duplicate
+        # check, which needs every page's full text, only if file_set_changed
+        self.changed_files: Optional[List[Path]] = None
+        self.project_changed = True
+        self.file_set_changed = True
+        # Also set by limit_to_changes(): the changed pages plus unchanged pages
+        # showing a changed image, which get the image check
+        self.image_files: Optional[List[Path]] = None
+        # Set by limit_to_changes(staged=True): changed pages, the inventory, the index
+        # and the file list come from the git index rather than the working tree
+        self.staged = False
+        
+        self.reset_results()
+    
+    def limit_to_changes(self, changes: Dict[str, str], staged: bool = False) -> bool:
+        """Restrict the next run to the paths in changes (from git_changed_paths)
+        
+        With staged, the changed pages, the inventory, the index and the file
+        list are read from the git index, so the run checks what is about to be
+        committed. Returns False if nothing in this project changed.
+        """
+        inventory_path = self.inventory_file.relative_to(self.github_folder).as_posix()
+        index_path = self.index_file.relative_to(self.github_folder).as_posix()
+        prefix = self.project_name + '/'
+        
+        changed_files = []
+        file_set_changed = False
+        project_changed = inventory_path in changes or index_path in changes
+        affected = project_changed
+        for path, status in changes.items():
+            if not path.startswith(prefix) or not path.endswith('.html') or '/' in path[len(prefix):]:
+                continue
+            affected = True
+            # A file added or removed changes the file set the project checks look at
+            if status in ('A', 'D'):
+                project_changed = file_set_changed = True
+            if status != 'D' and (staged or (self.github_folder / path).is_file()):
+                changed_files.append(self.github_folder / path)
+        
+        # An edited, added or deleted image affects every page showing it
+        image_files = list(changed_files)
+        changed_images = {self.github_folder / path for path in changes
+                          if path.lower().endswith(_IMAGE_SUFFIXES)}
+        if changed_images:
+            pages = [path for path in sorted(self.recipe_folder.glob('*.html')) if path not in changed_files]
+            image_files += self._pages_showing(pages, changed_images)
+            affected = affected or len(image_files) > len(changed_files)
+        
+        self.changed_files = changed_files
+        self.image_files = image_files
+        self.project_changed = project_changed
+        self.file_set_changed = file_set_changed
+        self.staged = staged
+        if staged and affected:
+            self._load_staged(changed_files, [inventory_path, index_path] if project_changed else [])
+        return affected
+    
+    def _pages_showing(self, html_files: List[Path], images: Set[Path]) -> List[Path]:
+        """The pages among html_files that reference any of images"""
+        return [
+            document.path for document in self.documents.load(html_files)
+            if any(resolve_site_url(source, self.recipe_folder, self.github_folder, self.site_host) in images
+                   for source in document.result.images)
+        ]
+    
+    def _load_staged(self, changed_files: List[Path], project_paths: List[str]):
+        """Seed the run with the staged content of the changed pages and project files"""
+        staged_files = list(changed_files)
+        if project_paths:
+            self._listed_html_files = [
+                self.github_folder / path
+                for path in git_staged_files(self.github_folder, self.project_name + '/*.html')
+                if '/' not in path[len(self.project_name) + 1:]
+            ]
+            # Pages deleted from the working tree but still staged are read from the index too
+            staged_files += [path for path in self._listed_html_files
+                             if path not in changed_files and not path.is_file()]
+        
+        page_paths = [path.relative_to(self.github_folder).as_posix() for path in staged_files]
+        blobs = git_staged_blobs(self.github_folder, page_paths + project_paths)
+        for path, key in zip(staged_files, page_paths):
+            data = blobs[key]
+            # No fingerprint: this content is not on disk, so it is never cached
+            self.documents.add(RecipeDocument(path, data.decode('utf-8')), parsed=True, bytes_read=len(data))
+        for path in project_paths:
+            if path in blobs:
+                # Same newline handling as reading in text mode
+                text = blobs[path].decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+                self._prefetched_text[self.github_folder / path] = text
+    
+    def reset_results(self):
+        """Clear findings and statistics before a (re-)run"""
+        self.reset_findings()
+        # Findings of the cacheable project-level checks
+        self._project_findings: List[Finding] = []
+        self.stats = {
+            'total_recipes_in_inventory': 0,
+            'completed_recipes_in_inventory': 0,
+            'html_files_found': 0,
+            'recipes_in_index': 0,
+        }
+        # Inventory recipe name -> (matched HTML filename, similarity)
+        self.inventory_matches: Dict[str, Tuple[str, float]] = {}
+        self.documents.reset_counters()
+        self.timings = PhaseTimings(self.documents)
+        # Filled by _prefetch() or _load_staged() and consumed by the loaders
+        self._prefetched_text: Dict[Path, str] = {}
+        self._listed_html_files: Optional[List[Path]] = None
+        self.html_files: List[Path] = []
+    
+    def validate_all(self) -> Tuple[Dict, Dict, Dict]:
+        """Run all validation checks"""
+        print(f"\n{'='*70}")
+        print(f"🔍 Validating Recipe Project: {self.project_name}")
+        print(f"{'='*70}\n")
+        
+        timings = self.timings
+        
+        # Check project structure exists
+        with timings.phase('project_structure'):
+            if not self._validate_project_structure():
+                return self.errors, self.warnings, self.stats
+        
+        # Read everything concurrently so the checks below never wait on I/O
+        if self.prefetch_concurrency > 0 and self.changed_files is None:
+            with timings.phase('prefetch_io') as record:
+                parse_seconds = self._prefetch()
+            # Parsing is interleaved with the reads; report it as its own phase
+            timings.split(record, 'prefetch_parse', parse_seconds)
+        
+        # After limit_to_changes(), the project-level inputs are only read if they changed
+        project_checks = self.changed_files is None or self.project_changed
+        if project_checks:
+            # Load inventory data
+            with timings.phase('load_inventory'):
+                inventory_recipes = self._load_inventory()
+            
+            # Load index data
+            with timings.phase('load_index'):
+                index_recipes = self._load_index()
+            
+            # Get HTML files
+            with timings.phase('scan_files'):
+                html_files = self.html_files = self._get_html_files()
+        else:
+            print("⏭️  Inventory, index and file set unchanged; skipping project-level checks\n")
+            inventory_recipes, index_recipes, html_files = {}, [], []
+        
+        checked_files = html_files if self.changed_files is None else self.changed_files
+        
+        if self.json_ld == 'inject':
+            with timings.phase('json_ld_inject'):
+                self._inject_json_ld(checked_files)
+        
+        # Run validations
+        with timings.phase('schema_compliance'):
+            self._validate_schema_compliance(checked_files)
+        with timings.phase('file_naming'):
+            self._validate_file_naming(checked_files)
+        if project_checks and (self.changed_files is None or self.file_set_changed):
+            with timings.phase('duplicates'):
+                self._detect_duplicates(html_files)
+        with timings.phase('images'):
+            self._validate_images(checked_files if self.image_files is None else self.image_files)
+        with timings.phase('rules'):
+            self._run_rules(inventory_recipes, html_files, index_recipes, checked_files, project_checks)
+        if project_checks:
+            self._run_project_checks(inventory_recipes, html_files, index_recipes)
+        
+        if self.search_index:
+            with timings.phase('search_index'):
+                self._write_search_index(html_files)
+        
+        if self.ingredient_table:
+            with timings.phase('ingredient_table'):
+                self._write_ingredient_table(html_files)
+        
+        if self.json_ld == 'export':
+            with timings.phase('json_ld_export'):
+                self._export_json_ld(html_files)
+        
+        return self.errors, self.warnings, self.stats
+    
+    def _run_project_checks(self, inventory_recipes: Dict, html_files: List[Path], index_recipes: List[Dict]):
+        """Run the cross-reference and ordering checks, reusing cached findings when possible"""
+        timings = self.timings
+        
+        # Staged content is not what the fingerprint reads from disk, so it is not cached
+        if self.cache is None or self.staged:
+            with timings.phase('cross_reference'):
+                self._cross_reference_inventory_files_index(inventory_recipes, html_files, index_recipes)
+            with timings.phase('alphabetical_order'):
+                self._validate_alphabetical_order(index_recipes)
+            return
+        
+        with timings.phase('project_fingerprint'):
+            fingerprint = self._project_fingerprint(html_files)
+            cached = self.cache.get_project(self.project_name, fingerprint)
+        
+        if cached is not None:
+            print("🔗 Inventory, index and file set unchanged; reusing cached cross-reference results\n")
+            for values in cached['findings']:
+                self._record(Finding.from_json(self.project_name, values))
+            self.inventory_matches.update(
+                (name, tuple(match)) for name, match in cached['inventory_matches'].items()
+            )
+            return
+        
+        with timings.phase('cross_reference'):
+            self._cross_reference_inventory_files_index(inventory_recipes, html_files, index_recipes)
+        with timings.phase('alphabetical_order'):
+            self._validate_alphabetical_order(index_recipes)
+        
+        self.cache.put_project(self.project_name, fingerprint, {
+            'findings': [finding.to_json() for finding in self._project_findings],
+            'inventory_matches': self.inventory_matches,
+        })
+    
+    def _write_search_index(self, html_files: List[Path]):
+        """Write the search artifact, unless it was built from the same file contents"""
+        print("🔎 Building search index...")
+        
+        documents = self.documents.load(html_files)
+        source = search_index_source(documents)
+        try:
+            with open(self.search_index_file, 'r', encoding='utf-8') as f:
+                current = json.load(f)
+        except (OSError, ValueError):
+            current = None
+        if isinstance(current, dict) and current.get('source') == source:
+            print(f"   ✓ {self.search_index_file.name} is up to date\n")
+            return
+        
+        index = build_search_index(self.project_name, documents)
+        write_file_atomic(self.search_index_file, json.dumps(index, ensure_ascii=False, separators=(',', ':')))
+        print(f"   ✓ Wrote {self.search_index_file.name} "
+              f"({len(index['recipes'])} recipes, {len(index['tokens'])} tokens)\n")
+    
+    def _write_ingredient_table(self, html_files: List[Path]):
+        """Write the ingredient table, if its content changed"""
+        print("🧾 Building ingredient table...")
+        
+        table = build_ingredient_table(self.documents.load(html_files))
+        try:
+            with open(self.ingredient_table_file, 'r', encoding='utf-8', newline='') as f:
+                current = f.read()
+        except OSError:
+            current = None
+        if current == table:
+            print(f"   ✓ {self.ingredient_table_file.name} is up to date\n")
+            return
+        
+        write_file_atomic(self.ingredient_table_file, table)
+        print(f"   ✓ Wrote {self.ingredient_table_file.name} ({table.count(chr(10)) - 1} ingredient lines)\n")
+    
+    def _inject_json_ld(self, html_files: List[Path]):
+        """Write each page's microdata into its JSON-LD block, adding one before </head> if missing
+        
+        Pages whose JSON-LD already agrees (known from the cached parse) are
+        not read; rewritten pages are parsed again by the checks that follow.
+        """
+        print("🏷️  Injecting JSON-LD...")
+        
+        updated = skipped = 0
+        for document in self.documents.load(html_files):
+            result = document.result
+            if not result.has_schema or result.json_ld == microdata_recipe_fields(result):
+                continue
+            
+            with open(document.path, 'r', encoding='utf-8', newline='') as f:
+                content = f.read()
+            self.timings.add(files=1, bytes_read=len(content.encode('utf-8')))
+            newline = '\r\n' if '\r\n' in content else '\n'
+            
+            existing = next((match for match in _JSON_LD_SCRIPT.finditer(content)
+                             if json_ld_recipe_fields(match.group(1)) is not None), None)
+            if existing is not None:
+                indent = re.match(r'[ \t]*', existing.group(0)).group(0)
+                start, end = existing.span()
+            else:
+                head_end = _HEAD_END.search(content)
+                if head_end is None:
+                    skipped += 1
+                    continue
+                indent = head_end.group(1) + '    '
+                start = end = head_end.start()
+            
+            write_file_atomic(document.path, content[:start] + json_ld_script(result, indent, newline) + content[end:])
+            self.documents.invalidate(document.path)
+            updated += 1
+        
+        if skipped:
+            print(f"   ⚠️  Skipped {skipped} pages without a </head>")
+        if updated:
+            print(f"   ✓ Updated JSON-LD in {updated} pages\n")
+        else:
+            print("   ✓ JSON-LD already up to date\n")
+    
+    def _export_json_ld(self, html_files: List[Path]):
+        """Write the JSON-LD of every recipe page to one file, if its content changed"""
+        print("🏷️  Exporting JSON-LD...")
+        
+        export = build_json_ld_export(self.documents.load(html_files))
+        text = json.dumps(export, ensure_ascii=False, indent=2) + '\n'
+        try:
+            with open(self.json_ld_file, 'r', encoding='utf-8', newline='') as f:
+                current = f.read()
+        except OSError:
+            current = None
+        if current == text:
+            print(f"   ✓ {self.json_ld_file.name} is up to date\n")
+            return
+        
+        write_file_atomic(self.json_ld_file, text)
+        print(f"   ✓ Wrote {self.json_ld_file.name} ({len(export['@graph'])} recipes)\n")
+    
+    def _record(self, finding: Finding):
+        super()._record(finding)
+        if finding.category in self.PROJECT_CHECK_CATEGORIES:
+            self._project_findings.append(finding)
+    
+    def _project_fingerprint(self, html_files: List[Path]) -> str:
+        """Hash of everything the project-level checks depend on"""
+        digest = hashlib.sha256()
+        for path in (self.inventory_file, self.index_file):
+            data = path.read_bytes()
+            self.timings.add(files=1, bytes_read=len(data))
+            digest.update(data)
+        for document in sorted(self.documents.load_names(html_files), key=lambda d: d.name):
+            for value in (document.name, document.result.name, document.result.title):
+                digest.update(value.encode('utf-8') + b'\0')
+        return digest.hexdigest()
+    
+    def apply_fixes(self) -> List[str]:
+        """Regenerate the index link list and the inventory statistics in place
+        
+        Run before validate_all() so the report describes the fixed files.
+        Each file is written atomically, and only if its content changed;
+        returns the names of the files written.
+        """
+        if not (self.recipe_folder.exists() and self.inventory_file.exists() and self.index_file.exists()):
+            return []
         
-        self.inventory_file = self.recipe_folder / 'recipe-inventory.md'
+        print("🛠️  Applying fixes...")
+        changed = []
+        with self.timings.phase('fix_index'):
+            if self._fix_index():
+                changed.append(self.index_file.name)
+        with self.timings.phase('fix_inventory'):
+            if self._fix_inventory():
+                changed.append(self.inventory_file.name)
         
-        self.errors = defaultdict(list)
-        self.warnings = defaultdict(list)
-        self.stats = {
-            'total_recipes_in_inventory': 0,
-            'completed_recipes_in_inventory': 0,
-            'html_files_found': 0,
-            'recipes_in_index': 0,
-        }
+        if changed:
+            print(f"   ✓ Rewrote {', '.join(changed)}\n")
+        else:
+            print("   ✓ Index and inventory already up to date\n")
+        return changed
     
-    def validate_all(self) -> Tuple[Dict, Dict, Dict]:
-        """Run all validation checks"""
-        print(f"\n{'='*70}")
-        print(f"🔍 Validating Recipe Project: {self.project_name}")
-        print(f"{'='*70}\n")
+    def _fix_index(self) -> bool:
+        """Rewrite the index's recipe links, sorted by the names parsed from the recipe files
         
-        # Check project structure exists
-        if not self._validate_project_structure():
-            return self.errors, self.warnings, self.stats
+        Links to missing files are dropped and recipe pages missing from the
+        index are added, except near-duplicates of a page already listed.
+        """
+        with open(self.index_file, 'r', encoding='utf-8', newline='') as f:
+            content = f.read()
+        self.timings.add(files=1, bytes_read=len(content.encode('utf-8')))
         
-        # Load inventory data
-        inventory_recipes = self._load_inventory()
+        pattern = re.compile(rf'^([ \t]*)<li>{index_link_pattern(self.project_name)}</li>[ \t]*(\r?\n)', re.M)
+        matches = list(pattern.finditer(content))
+        if not matches:
+            print(f"   ⚠️  No recipe links found in {self.index_file.name}; not rewritten")
+            return False
+        if any(before.end() != after.start() for before, after in zip(matches, matches[1:])):
+            print(f"   ⚠️  Recipe links in {self.index_file.name} are split across several lists; not rewritten")
+            return False
         
-        # Load index data
-        index_recipes = self._load_index()
+        documents = {document.name: document
+                     for document in self.documents.load(list(self.recipe_folder.glob('*.html')))}
+        listed = list(dict.fromkeys(match.group(3) for match in matches if match.group(3) in documents))
+        # Extra attributes on a link (e.g. class="light-blue") are kept
+        attributes = {match.group(3): (match.group(2), match.group(4)) for match in matches}
+        included = set(listed)
+        unlisted = [name for name in sorted(documents)
+                    if name not in included and documents[name].result.has_schema]
         
-        # Get HTML files
-        html_files = self._get_html_files()
+        # Leave out an unlisted page that duplicates a listed (or earlier added) one
+        duplicate_of = defaultdict(set)
+        for first, second, _ in self._duplicate_pairs([documents[name] for name in listed + unlisted]):
+            duplicate_of[first.name].add(second.name)
+            duplicate_of[second.name].add(first.name)
+        for name in unlisted:
+            if not duplicate_of[name] & included:
+                included.add(name)
         
-        # Run validations
-        self._validate_schema_compliance(html_files)
-        self._validate_file_naming(html_files)
-        self._cross_reference_inventory_files_index(inventory_recipes, html_files, index_recipes)
-        self._validate_alphabetical_order(index_recipes)
+        indent, newline = matches[0].group(1), matches[0].group(6)
+        # Same ordering as _validate_alphabetical_order(), ties broken by filename
+        entries = sorted(
+            ((_display_name(documents[name]), name) for name in included),
+            key=lambda entry: (normalize_recipe_name(entry[0]), entry[1]),
+        )
+        lines = []
+        for display_name, filename in entries:
+            before, after = attributes.get(filename, ('', ''))
+            lines.append(f'{indent}<li><a{before} href="{self.project_name}/{filename}"{after}>'
+                         f'{html.escape(display_name, quote=False)}</a></li>{newline}')
         
-        return self.errors, self.warnings, self.stats
+        fixed = content[:matches[0].start()] + ''.join(lines) + content[matches[-1].end():]
+        if fixed == content:
+            return False
+        write_file_atomic(self.index_file, fixed)
+        return True
+    
+    def _fix_inventory(self) -> bool:
+        """Recompute the Total/Completed/Missing/Progress lines from the [x] and [ ] entries"""
+        with open(self.inventory_file, 'r', encoding='utf-8', newline='') as f:
+            content = f.read()
+        self.timings.add(files=1, bytes_read=len(content.encode('utf-8')))
+        
+        # Same entry format as _load_inventory()
+        entries = re.findall(r'- \[([ x])\] (.+?) \(p\.(\d+)\)', content)
+        total = len(entries)
+        completed = sum(1 for mark, _, _ in entries if mark == 'x')
+        progress = completed * 100 // total if total else 0
+        
+        fixed = content
+        for label, value in (('Total recipes', str(total)), ('Completed', str(completed)),
+                             ('Missing', str(total - completed))):
+            fixed = re.sub(rf'(\*\*{label}:\*\* )\d+', lambda match: match.group(1) + value, fixed, count=1)
+        fixed = re.sub(r'(\*\*Progress:\*\* )\d+%( ✅)?',
+                       lambda match: f"{match.group(1)}{progress}%{' ✅' if progress == 100 else ''}", fixed, count=1)
+        
+        if fixed == content:
+            return False
+        write_file_atomic(self.inventory_file, fixed)
+        return True
     
     def _validate_project_structure(self) -> bool:
         """Check that required files and folders exist"""
         print("📁 Checking project structure...")
         
         if not self.recipe_folder.exists():
-            self.errors['structure'].append(f"Recipe folder not found: {self.recipe_folder}")
+            self._error('structure', 'recipe_folder_missing', str(self.recipe_folder))
             return False
         
         if not self.inventory_file.exists():
-            self.errors['structure'].append(f"Inventory file not found: {self.inventory_file}")
+            self._error('structure', 'inventory_missing', str(self.inventory_file))
             return False
         
         if not self.index_file.exists():
-            self.errors['structure'].append(f"Index file not found: {self.index_file}")
+            self._error('structure', 'index_missing', str(self.index_file))
             return False
         
         print(f"   ✓ Recipe folder: {self.recipe_folder.name}")
@@ -167,14 +2283,44 @@ class RecipeProjectValidator:
         
         return True
     
+    def _prefetch(self) -> float:
+        """Read the inventory, index and recipe files on a bounded thread pool
+        
+        Returns the seconds spent parsing recipe files as their reads complete.
+        """
+        print(f"⚡ Prefetching files ({self.prefetch_concurrency} concurrent reads)...")
+        
+        self._listed_html_files = list(self.recipe_folder.glob('*.html'))
+        self.timings.add(files=len(self._listed_html_files))
+        
+        with ThreadPoolExecutor(max_workers=self.prefetch_concurrency) as pool:
+            texts = {path: pool.submit(path.read_bytes) for path in (self.inventory_file, self.index_file)}
+            parse_seconds = self.documents.prefetch(self._listed_html_files, pool, self.prefetch_concurrency)
+            for path, future in texts.items():
+                data = future.result()
+                self.timings.add(files=1, bytes_read=len(data))
+                # Same newline handling as reading in text mode
+                self._prefetched_text[path] = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        
+        print(f"   ✓ Read {len(self._listed_html_files) + len(texts)} files\n")
+        return parse_seconds
+    
+    def _read_text(self, path: Path) -> str:
+        """Text of a project file, from the prefetch buffer when available"""
+        content = self._prefetched_text.pop(path, None)
+        if content is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+                self.timings.add(files=1, bytes_read=os.fstat(f.fileno()).st_size)
+        return content
+    
     def _load_inventory(self) -> Dict[str, Dict]:
         """Parse inventory file and return recipe data"""
         print("📋 Loading inventory...")
         
         recipes = {}
         
-        with open(self.inventory_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = self._read_text(self.inventory_file)
         
         # Find all recipe entries
         # Format: - [ ] or - [x] Recipe Name (p.XXX)
@@ -198,18 +2344,18 @@ class RecipeProjectValidator:
         if completed_match:
             claimed_completed = int(completed_match.group(1))
             if claimed_completed != self.stats['completed_recipes_in_inventory']:
-                self.errors['inventory'].append(
-                    f"Inventory statistics mismatch: Claims {claimed_completed} completed, "
-                    f"but found {self.stats['completed_recipes_in_inventory']} marked as [x]"
+                self._error('inventory', 'inventory_completed_mismatch',
+                    claimed_completed, self.stats['completed_recipes_in_inventory'],
+                    file=self.inventory_file.name
                 )
         
         if missing_match:
             claimed_missing = int(missing_match.group(1))
             actual_missing = self.stats['total_recipes_in_inventory'] - self.stats['completed_recipes_in_inventory']
             if claimed_missing != actual_missing:
-                self.errors['inventory'].append(
-                    f"Inventory statistics mismatch: Claims {claimed_missing} missing, "
-                    f"but found {actual_missing} unchecked"
+                self._error('inventory', 'inventory_missing_mismatch',
+                    claimed_missing, actual_missing,
+                    file=self.inventory_file.name
                 )
         
         print(f"   ✓ Found {len(recipes)} recipes in inventory")
@@ -224,15 +2370,13 @@ class RecipeProjectValidator:
         
         recipes = []
         
-        with open(self.index_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = self._read_text(self.index_file)
         
         # Find all recipe links
-        # Format: <a href="Project Name/filename.html">Display Name</a>
-        pattern = rf'<a href="{re.escape(self.project_name)}/([^"]+)">([^<]+)</a>'
-        matches = re.findall(pattern, content)
+        # Format: <a href="Project Name/filename.html">Display Name</a>, possibly with more attributes
+        matches = re.findall(index_link_pattern(self.project_name), content)
         
-        for filename, display_name in matches:
+        for _, filename, _, display_name in matches:
             recipes.append({
                 'filename': filename,
                 'display_name': display_name.strip(),
@@ -248,9 +2392,15 @@ class RecipeProjectValidator:
         """Get all HTML files in recipe folder"""
         print("📄 Scanning HTML files...")
         
-        html_files = list(self.recipe_folder.glob('*.html'))
+        html_files = self._listed_html_files
+        if html_files is None:
+            html_files = list(self.recipe_folder.glob('*.html'))
+            self.timings.add(files=len(html_files))
         self.stats['html_files_found'] = len(html_files)
         
+        if self.cache is not None:
+            self.cache.prune(self.recipe_folder, html_files)
+        
         print(f"   ✓ Found {len(html_files)} HTML files\n")
         
         return html_files
@@ -261,42 +2411,42 @@ class RecipeProjectValidator:
         
         schema_issues = []
         
-        for html_file in html_files:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            parser = RecipeSchemaParser()
-            parser.feed(content)
-            result = parser.get_validation_result()
+        documents = self.documents.load(html_files)
+        self.timings.add(files=len(documents))
+        if self.cache is not None:
+            parsed = self.documents.files_parsed
+            print(f"   ✓ Reused {len(documents) - parsed} cached results, parsed {parsed} files")
+        
+        for document in documents:
+            result = document.result
             
             # Check for issues
             issues = []
             
-            if not result['has_schema']:
-                issues.append("Missing Recipe schema (itemtype)")
-            if not result['has_name']:
-                issues.append("Missing recipe name (itemprop='name')")
-            if not result['has_description']:
-                issues.append("Missing description (itemprop='description')")
-            if not result['has_yield']:
-                issues.append("Missing yield (itemprop='recipeYield')")
-            if not result['has_image']:
-                issues.append("Missing image (itemprop='image')")
-            if result['ingredient_count'] == 0:
-                issues.append("No ingredients with itemprop='recipeIngredient'")
-            if result['instruction_count'] == 0:
-                issues.append("No instructions with itemprop='recipeInstructions'")
-            if result['schema_errors']['ingredients_on_parent']:
-                issues.append("❌ CRITICAL: itemprop='recipeIngredient' found on parent element (must be on <li> tags)")
-            if result['schema_errors']['instructions_on_parent']:
-                issues.append("❌ CRITICAL: itemprop='recipeInstructions' found on parent element (must be on <li> tags)")
+            if not result.has_schema:
+                issues.append('missing_schema')
+            if not result.has_name:
+                issues.append('missing_name')
+            if not result.has_description:
+                issues.append('missing_description')
+            if not result.has_yield:
+                issues.append('missing_yield')
+            if not result.has_image:
+                issues.append('missing_image')
+            if result.ingredient_count == 0:
+                issues.append('no_ingredients')
+            if result.instruction_count == 0:
+                issues.append('no_instructions')
+            if result.ingredients_on_parent:
+                issues.append('ingredients_on_parent')
+            if result.instructions_on_parent:
+                issues.append('instructions_on_parent')
             
+            # One finding per issue; the text report groups them by file
+            for code in issues:
+                self._error('schema', code, file=document.name)
             if issues:
-                self.errors['schema'].append({
-                    'file': html_file.name,
-                    'issues': issues
-                })
-                schema_issues.append(html_file.name)
+                schema_issues.append(document.name)
         
         if schema_issues:
             print(f"   ⚠️  Found schema issues in {len(schema_issues)} files\n")
@@ -309,31 +2459,138 @@ class RecipeProjectValidator:
         
         naming_issues = []
         
-        for html_file in html_files:
-            filename = html_file.name
-            
-            # Check for spaces
-            if ' ' in filename:
-                self.errors['naming'].append(f"{filename}: Contains spaces (should use hyphens)")
-                naming_issues.append(filename)
-                continue
-            
-            # Check for uppercase letters (except .html extension)
-            name_without_ext = filename[:-5]  # Remove .html
-            if name_without_ext != name_without_ext.lower():
-                self.errors['naming'].append(f"{filename}: Contains uppercase letters (should be all lowercase)")
-                naming_issues.append(filename)
-                continue
-            
-            # Check for special characters (allow only letters, numbers, hyphens)
-            if not re.match(r'^[a-z0-9-]+\.html$', filename):
-                self.warnings['naming'].append(f"{filename}: Contains special characters (should only have letters, numbers, hyphens)")
+        self.timings.add(files=len(html_files))
+        for document in self.documents.load(html_files):
+            verdict = document.naming
+            for code in verdict['errors']:
+                self._error('naming', code, document.name, file=document.name)
+            for code in verdict['warnings']:
+                self._warning('naming', code, document.name, file=document.name)
+            if verdict['errors']:
+                naming_issues.append(document.name)
         
         if naming_issues:
             print(f"   ⚠️  Found naming issues in {len(naming_issues)} files\n")
         else:
             print(f"   ✓ All filenames follow naming convention\n")
     
+    def _detect_duplicates(self, html_files: List[Path]):
+        """Find recipes transcribed twice, e.g. under a hyphenated and an underscored filename"""
+        print("🧬 Checking for duplicate recipes...")
+        
+        documents = self.documents.load(html_files)
+        self.timings.add(files=len(documents))
+        
+        duplicates = self._duplicate_pairs(documents)
+        for first, second, similarity in duplicates:
+            self._warning('duplicates', 'possible_duplicate',
+                          first.name, second.name, _display_name(first), similarity, file=first.name)
+        
+        if duplicates:
+            print(f"   ⚠️  Found {len(duplicates)} possible duplicate pairs\n")
+        else:
+            print(f"   ✓ No duplicate recipes found\n")
+    
+    def _duplicate_pairs(self, documents: List[RecipeDocument]) -> List[Tuple[RecipeDocument, RecipeDocument, float]]:
+        """Near-duplicate pairs whose recipe names also match"""
+        return [
+            (first, second, similarity)
+            for first, second, similarity in find_near_duplicates(documents, self.DUPLICATE_TEXT_THRESHOLD)
+            if name_similarity(_display_name(first), _display_name(second)) >= RecipeTitleIndex.FUZZY_THRESHOLD
+        ]
+    
+    def _validate_images(self, html_files: List[Path]):
+        """Check that referenced images exist and are sized for the web
+        
+        Pages mostly share one cover photo, so each unique image is resolved
+        and its header read once, however many pages use it.
+        """
+        print("🖼️  Validating images...")
+        
+        pages_by_image: Dict[Path, List[str]] = defaultdict(list)
+        for document in self.documents.load(html_files):
+            for source in document.result.images:
+                path = resolve_site_url(source, self.recipe_folder, self.github_folder, self.site_host)
+                # Images hosted elsewhere cannot be checked offline
+                if path is not None:
+                    pages_by_image[path].append(document.name)
+        
+        problems = 0
+        for path, pages in pages_by_image.items():
+            pages.sort()
+            image = os.path.relpath(path, self.github_folder)
+            used_by = pages[0] if len(pages) == 1 else f"{pages[0]} and {len(pages) - 1} other pages"
+            
+            try:
+                info = read_image_header(path)
+            except OSError:
+                self._error('images', 'image_missing', image, used_by, file=pages[0])
+                problems += 1
+                continue
+            self.timings.add(files=1)
+            
+            issues = self._image_issues(info)
+            for code, args in issues:
+                self._warning('images', code, image, used_by, *args, file=pages[0])
+            if issues:
+                problems += 1
+        
+        if problems:
+            print(f"   ⚠️  Found issues with {problems} of {len(pages_by_image)} images\n")
+        else:
+            print(f"   ✓ All {len(pages_by_image)} images found and web-sized\n")
+    
+    def _image_issues(self, info: Optional[Dict]) -> List[Tuple[str, Tuple]]:
+        """Reasons (finding code and message args) an image, as read by read_image_header, is not fit for the web"""
+        if info is None:
+            return [('image_unknown_format', ())]
+        
+        issues = []
+        width, height, kilobytes = info['width'], info['height'], info['bytes'] // 1024
+        if info['bytes'] > self.IMAGE_MAX_BYTES:
+            issues.append(('image_too_heavy', (kilobytes, self.IMAGE_MAX_BYTES // 1024)))
+        if max(width, height) > self.IMAGE_MAX_DIMENSION:
+            issues.append(('image_too_large', (width, height, self.IMAGE_MAX_DIMENSION)))
+        if info['format'] == 'JPEG' and width and height and \
+                info['bytes'] / (width * height) > self.IMAGE_MAX_JPEG_BYTES_PER_PIXEL:
+            issues.append(('image_not_optimized', (kilobytes, width, height)))
+        return issues
+    
+    def _run_rules(self, inventory_recipes: Dict, html_files: List[Path], index_recipes: List[Dict],
+                   checked_files: Optional[List[Path]] = None, project_checks: bool = True):
+        """Run the registered rules for this project in one pass over the parsed documents
+        
+        File checks run on checked_files (default: html_files), project checks on
+        html_files if project_checks is set.
+        """
+        rules = [rule for rule in RULES if rule.applies_to(self.project_name)]
+        if not rules:
+            return
+        print("📏 Running rules...")
+        
+        documents = self.documents.load(html_files if checked_files is None else checked_files)
+        self.timings.add(files=len(documents))
+        found = sum(self.finding_counts.values())
+        
+        file_rules = [rule for rule in rules if type(rule).check_file is not RecipeRule.check_file]
+        for document in documents:
+            rule_data = document.result.rule_data
+            for rule in file_rules:
+                for code, args in rule.check_file(document, rule_data.get(rule.name)):
+                    self._record(Finding(self.project_name, rule.severity, rule.category, code, args, document.name))
+        if project_checks:
+            if checked_files is not None:
+                documents = self.documents.load(html_files)
+            for rule in rules:
+                for code, args, file in rule.check_project(documents, inventory_recipes, index_recipes):
+                    self._record(Finding(self.project_name, rule.severity, rule.category, code, args, file))
+        
+        found = sum(self.finding_counts.values()) - found
+        if found:
+            print(f"   ⚠️  Found {found} issues with {len(rules)} rules\n")
+        else:
+            print(f"   ✓ All {len(rules)} rules pass\n")
+    
     def _cross_reference_inventory_files_index(self, inventory_recipes: Dict, html_files: List[Path], index_recipes: List[Dict]):
         """Cross-reference inventory, HTML files, and index"""
         print("🔗 Cross-referencing inventory, files, and index...")
@@ -343,44 +2600,41 @@ class RecipeProjectValidator:
         html_filenames = {f.name for f in html_files}
         index_filenames = {r['filename'] for r in index_recipes}
         
+        title_index = RecipeTitleIndex(self.documents.load_names(html_files))
+        self.timings.add(files=len(html_files))
+        
         # Find completed recipes without HTML files
-        for recipe_name in completed_in_inventory:
-            # Try to find corresponding HTML file
-            found = False
-            for html_file in html_files:
-                # Read HTML to check if title matches
-                with open(html_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                if recipe_name in content:
-                    found = True
-                    break
+        for recipe_name in sorted(completed_in_inventory):
+            document, score = title_index.match(recipe_name)
+            
+            if document is None:
+                self._warning('cross_reference', 'inventory_recipe_unmatched', recipe_name)
+                continue
             
-            if not found:
-                self.warnings['cross_reference'].append(
-                    f"Recipe marked complete in inventory but no matching HTML found: {recipe_name}"
+            self.inventory_matches[recipe_name] = (document.name, score)
+            if score < 1.0:
+                self._warning('cross_reference', 'inventory_recipe_fuzzy_match',
+                    document.name, score, recipe_name,
+                    file=document.name
                 )
         
         # Find HTML files not in index
         for html_file in html_files:
             if html_file.name not in index_filenames:
-                self.errors['cross_reference'].append(
-                    f"HTML file exists but not in index: {html_file.name}"
-                )
+                self._error('cross_reference', 'file_not_in_index', html_file.name, file=html_file.name)
         
         # Find index entries with missing files
         for recipe in index_recipes:
             if not recipe['path'].exists():
-                self.errors['cross_reference'].append(
-                    f"Index links to non-existent file: {recipe['filename']}"
+                self._error('cross_reference', 'index_links_missing_file',
+                    recipe['filename'], file=recipe['filename']
                 )
         
         # Check for HTML files without matching index entry
         orphaned_files = html_filenames - index_filenames
         if orphaned_files:
             for filename in orphaned_files:
-                self.errors['cross_reference'].append(
-                    f"HTML file not linked in index: {filename}"
-                )
+                self._error('cross_reference', 'file_not_linked', filename, file=filename)
         
         print(f"   ✓ Cross-reference complete\n")
     
@@ -391,20 +2645,24 @@ class RecipeProjectValidator:
         if not index_recipes:
             return
         
-        prev_name = ""
+        prev_name = prev_key = ""
         out_of_order = []
         
         for recipe in index_recipes:
             current_name = recipe['display_name']
             
-            if prev_name and current_name.lower() < prev_name.lower():
-                out_of_order.append(f"{current_name} comes after {prev_name}")
+            # Compare as --fix sorts: ignoring case, accents and punctuation
+            current_key = normalize_recipe_name(html.unescape(current_name))
+            if prev_name and current_key < prev_key:
+                out_of_order.append((current_name, prev_name))
             
-            prev_name = current_name
+            prev_name, prev_key = current_name, current_key
         
         if out_of_order:
-            self.errors['alphabetical'].append("Index is not in alphabetical order:")
-            self.errors['alphabetical'].extend(out_of_order)
+            self._error('alphabetical', 'index_not_sorted', file=self.index_file.name)
+            for current_name, prev_name in out_of_order:
+                self._error('alphabetical', 'index_out_of_order', current_name, prev_name,
+                            file=self.index_file.name)
             print(f"   ⚠️  Found {len(out_of_order)} ordering issues\n")
         else:
             print(f"   ✓ Index is properly alphabetized\n")
@@ -415,46 +2673,392 @@ class RecipeProjectValidator:
         print("📊 QA VALIDATION REPORT")
         print(f"{'='*70}\n")
         
-        print("STATISTICS:")
-        print(f"  • Total recipes in inventory: {self.stats['total_recipes_in_inventory']}")
-        print(f"  • Completed in inventory: {self.stats['completed_recipes_in_inventory']}")
-        print(f"  • HTML files found: {self.stats['html_files_found']}")
-        print(f"  • Recipes in index: {self.stats['recipes_in_index']}")
-        print()
+        _print_statistics(self.stats)
         
-        # Count total issues
-        total_errors = sum(len(v) if isinstance(v, list) else 1 for v in self.errors.values())
-        total_warnings = sum(len(v) if isinstance(v, list) else 1 for v in self.warnings.values())
+        if self.inventory_matches:
+            print(f"INVENTORY MATCHES ({len(self.inventory_matches)}):")
+            for recipe_name, (filename, score) in sorted(self.inventory_matches.items()):
+                similarity = "" if score == 1.0 else f" (fuzzy, {score:.0%})"
+                print(f"  • {recipe_name} → {filename}{similarity}")
+            print()
         
-        if total_errors == 0 and total_warnings == 0:
-            print("✅ ALL CHECKS PASSED! Project is ready for deployment.")
-            return
+        _print_findings(self.findings)
+
+
+class SiteLinkChecker(FindingRecorder):
+    """Link graph of every HTML page in the GitHub folder, project or not
+    
+    Reports links to missing pages, pages nothing links to (orphans) and
+    pages that are linked but cannot be reached from index.html. Findings,
+    stats and timings have the same shape as RecipeProjectValidator's, so
+    the report, JSON output and exit code handle both.
+    """
+    
+    # URL schemes that never point into the site
+    EXTERNAL_SCHEMES = ('mailto', 'tel', 'javascript', 'data')
+    
+    def __init__(self, github_folder: str, cache: Optional[ValidationCache] = None,
+                 finding_sink: Optional[Callable[[Finding], None]] = None, retain_findings: bool = True,
+                 site_host: Optional[str] = None):
+        self.github_folder = Path(github_folder)
+        self.project_name = 'Site links'
+        self.site_host = site_host
+        self.start_page = self.github_folder / 'index.html'
+        # Pages share the per-file parse cache with the project validators
+        self.cache = cache
+        self.documents = RecipeDocumentStore(cache)
+        self.finding_sink = finding_sink
+        self.retain_findings = retain_findings
+        self.inventory_matches: Dict[str, Tuple[str, float]] = {}
+        self.reset_results()
+    
+    def reset_results(self):
+        """Clear findings and statistics before a (re-)run"""
+        self.reset_findings()
+        self.stats = {'html_pages': 0, 'links': 0, 'distinct_targets': 0}
+        self.documents.reset_counters()
+        self.timings = PhaseTimings(self.documents)
+        # Normalized target path -> page it resolves to (None if missing)
+        self._resolved: Dict[str, Optional[Path]] = {}
+    
+    def check(self) -> Tuple[Dict, Dict, Dict]:
+        """Build the link graph and report broken links, orphans and unreachable pages"""
+        print(f"\n{'='*70}")
+        print("🔗 Checking site links")
+        print(f"{'='*70}\n")
         
-        if self.errors:
-            print(f"❌ ERRORS FOUND ({total_errors}):")
-            print("-" * 70)
-            for category, issues in self.errors.items():
-                print(f"\n{category.upper()}:")
-                if isinstance(issues, list):
-                    for issue in issues:
-                        if isinstance(issue, dict):
-                            print(f"  • {issue['file']}:")
-                            for detail in issue['issues']:
-                                print(f"      - {detail}")
-                        else:
-                            print(f"  • {issue}")
-            print()
+        timings = self.timings
+        with timings.phase('scan_pages'):
+            pages = self._get_pages()
+        with timings.phase('link_graph'):
+            graph = self._build_graph(pages)
+        with timings.phase('reachability'):
+            self._check_reachability(pages, graph)
         
-        if self.warnings:
-            print(f"⚠️  WARNINGS ({total_warnings}):")
-            print("-" * 70)
-            for category, issues in self.warnings.items():
-                print(f"\n{category.upper()}:")
-                for issue in issues:
-                    print(f"  • {issue}")
-            print()
+        return self.errors, self.warnings, self.stats
+    
+    def _page_name(self, path: Path) -> str:
+        return path.relative_to(self.github_folder).as_posix()
+    
+    def _get_pages(self) -> List[Path]:
+        """Every HTML file under the GitHub folder, skipping hidden folders like .git"""
+        print("📄 Scanning HTML pages...")
+        
+        pages = []
+        for folder, subfolders, filenames in os.walk(self.github_folder):
+            subfolders[:] = sorted(name for name in subfolders if not name.startswith('.'))
+            pages.extend(Path(folder, name) for name in sorted(filenames) if name.endswith('.html'))
+        self.stats['html_pages'] = len(pages)
+        self.timings.add(files=len(pages))
+        
+        if self.cache is not None:
+            for folder in {path.relative_to(self.github_folder).parts[0] for path in pages
+                           if path.parent != self.github_folder}:
+                folder_path = self.github_folder / folder
+                self.cache.prune(folder_path, [path for path in pages if folder_path in path.parents])
+        
+        print(f"   ✓ Found {len(pages)} HTML pages\n")
+        return pages
+    
+    def _build_graph(self, pages: List[Path]) -> Dict[Path, Set[Path]]:
+        """Parse every page once and resolve its links; reports broken links"""
+        print("🕸️  Resolving links...")
+        
+        graph: Dict[Path, Set[Path]] = {}
+        broken = 0
+        for document in self.documents.load(pages):
+            targets = set()
+            for href in document.result.links:
+                self.stats['links'] += 1
+                path = self._link_path(href, document.path.parent)
+                if path is None:
+                    continue
+                target = self._resolve(path)
+                if target is None:
+                    broken += 1
+                    page_name = self._page_name(document.path)
+                    self._error('broken_links', 'broken_link', page_name, href, file=page_name)
+                elif target != document.path:
+                    targets.add(target)
+            graph[document.path] = targets
+        self.stats['distinct_targets'] = len(self._resolved)
+        
+        if broken:
+            print(f"   ⚠️  Found {broken} broken links\n")
+        else:
+            print(f"   ✓ All {self.stats['links']} links resolve\n")
+        return graph
+    
+    def _link_path(self, href: str, page_folder: Path) -> Optional[Path]:
+        """Local path a link points to, or None for external links and same-page anchors"""
+        if href.split(':', 1)[0].lower() in self.EXTERNAL_SCHEMES:
+            return None
+        parsed = urllib.parse.urlsplit(href)
+        if not parsed.path and not parsed.netloc:
+            # Only a fragment or query string: the page itself
+            return None
+        return resolve_site_url(href, page_folder, self.github_folder, self.site_host)
+    
+    def _resolve(self, path: Path) -> Optional[Path]:
+        """Page a local path is served from, like GitHub Pages does; memoized per target
+        
+        A folder serves its index.html and an extensionless path its .html
+        file. Paths outside the GitHub folder never resolve.
+        """
+        key = os.path.normpath(path)
+        if key in self._resolved:
+            return self._resolved[key]
+        
+        target = None
+        root = os.path.normpath(self.github_folder)
+        if key == root or key.startswith(root + os.sep):
+            if os.path.isfile(key):
+                target = Path(key)
+            elif os.path.isdir(key) and os.path.isfile(os.path.join(key, 'index.html')):
+                target = Path(key, 'index.html')
+            elif os.path.isfile(key + '.html'):
+                target = Path(key + '.html')
+        self._resolved[key] = target
+        return target
+    
+    def _check_reachability(self, pages: List[Path], graph: Dict[Path, Set[Path]]):
+        """Report pages with no incoming links, and linked pages index.html cannot reach"""
+        print("🧭 Checking reachability from index.html...")
+        
+        linked = set()
+        for targets in graph.values():
+            linked.update(targets)
+        
+        reachable = set()
+        if self.start_page in graph:
+            reachable.add(self.start_page)
+            frontier = [self.start_page]
+            while frontier:
+                page = frontier.pop()
+                for target in graph.get(page, ()):
+                    if target not in reachable:
+                        reachable.add(target)
+                        frontier.append(target)
+        else:
+            self._error('structure', 'start_page_missing', str(self.start_page))
+        
+        orphans = unreachable = 0
+        for page in pages:
+            if page == self.start_page or page in reachable:
+                continue
+            name = self._page_name(page)
+            if page not in linked:
+                orphans += 1
+                self._warning('orphan_pages', 'orphan_page', name, file=name)
+            else:
+                unreachable += 1
+                self._warning('unreachable_pages', 'unreachable_page', name, file=name)
         
+        if orphans or unreachable:
+            print(f"   ⚠️  Found {orphans} orphan and {unreachable} unreachable pages\n")
+        else:
+            print(f"   ✓ All {len(pages)} pages reachable\n")
+    
+    def print_report(self):
+        """Print formatted link report"""
+        print(f"\n{'='*70}")
+        print("📊 SITE LINK REPORT")
         print(f"{'='*70}\n")
+        
+        print("STATISTICS:")
+        print(f"  • HTML pages: {self.stats['html_pages']}")
+        print(f"  • Links checked: {self.stats['links']}")
+        print(f"  • Distinct local targets: {self.stats['distinct_targets']}")
+        print()
+        
+        _print_findings(self.findings)
+
+
+# Categories the text report lists by file, with each file's findings beneath it
+GROUPED_CATEGORIES = ('schema',)
+
+
+def _messages_by_category(findings: List[Finding], severity: str) -> Dict[str, List]:
+    """Formatted messages of the findings of one severity, by category
+    
+    Grouped categories hold {'file', 'issues'} entries, one per file, as
+    validate_all() has always returned them; other categories hold messages.
+    """
+    messages = defaultdict(list)
+    for finding in findings:
+        if finding.severity != severity:
+            continue
+        entries = messages[finding.category]
+        if finding.category in GROUPED_CATEGORIES:
+            if not entries or entries[-1]['file'] != finding.file:
+                entries.append({'file': finding.file, 'issues': []})
+            entries[-1]['issues'].append(finding.message)
+        else:
+            entries.append(finding.message)
+    return messages
+
+
+def _count_issues(findings: List[Finding], severity: str) -> int:
+    """Count issues as the report lists them: grouped categories once per file"""
+    count = 0
+    grouped = set()
+    for finding in findings:
+        if finding.severity != severity:
+            continue
+        if finding.category in GROUPED_CATEGORIES:
+            grouped.add((finding.project, finding.category, finding.file))
+        else:
+            count += 1
+    return count + len(grouped)
+
+
+def _report_sections(findings: List[Finding], severity: str, show_project: bool) -> Dict[str, List]:
+    """Report lines of one severity by category: messages, or (file, messages) in grouped categories"""
+    sections: Dict[str, List] = {}
+    for finding in findings:
+        if finding.severity != severity:
+            continue
+        lines = sections.setdefault(finding.category, [])
+        if finding.category in GROUPED_CATEGORIES:
+            file = f"{finding.project}/{finding.file}" if show_project else finding.file
+            if not lines or lines[-1][0] != file:
+                lines.append((file, []))
+            lines[-1][1].append(finding.message)
+        elif show_project:
+            lines.append(f"[{finding.project}] {finding.message}")
+        else:
+            lines.append(finding.message)
+    return sections
+
+
+def _print_statistics(stats: Dict):
+    """Print the statistics block of a report"""
+    print("STATISTICS:")
+    print(f"  • Total recipes in inventory: {stats['total_recipes_in_inventory']}")
+    print(f"  • Completed in inventory: {stats['completed_recipes_in_inventory']}")
+    print(f"  • HTML files found: {stats['html_files_found']}")
+    print(f"  • Recipes in index: {stats['recipes_in_index']}")
+    print()
+
+
+def _print_findings(findings: List[Finding], show_project: bool = False):
+    """Print the errors and warnings blocks of a report, prefixing messages with their project if asked"""
+    # Count total issues
+    total_errors = _count_issues(findings, 'error')
+    total_warnings = _count_issues(findings, 'warning')
+    
+    if total_errors == 0 and total_warnings == 0:
+        print("✅ ALL CHECKS PASSED! Project is ready for deployment.")
+        return
+    
+    for heading, severity in ((f"❌ ERRORS FOUND ({total_errors}):", 'error'),
+                              (f"⚠️  WARNINGS ({total_warnings}):", 'warning')):
+        sections = _report_sections(findings, severity, show_project)
+        if not sections:
+            continue
+        print(heading)
+        print("-" * 70)
+        for category, lines in sections.items():
+            print(f"\n{category.upper()}:")
+            for line in lines:
+                if isinstance(line, tuple):
+                    file, messages = line
+                    print(f"  • {file}:")
+                    for message in messages:
+                        print(f"      - {message}")
+                else:
+                    print(f"  • {line}")
+        print()
+    
+    print(f"{'='*70}\n")
+
+
+def _parse_recipe_chunk(paths: List[str]) -> List[Tuple[str, Tuple[int, int, str], RecipeResult]]:
+    """Parse a chunk of recipe files (runs in a worker process)"""
+    records = []
+    for path in paths:
+        document = RecipeDocument.from_file(Path(path))
+        records.append((path, document.fingerprint, document.result))
+    return records
+
+
+def validate_projects_parallel(github_folder: str, projects: List[str],
+                               max_workers: Optional[int] = None,
+                               chunk_size: int = 32,
+                               cache: Optional[ValidationCache] = None,
+                               finding_sink: Optional[Callable[[Finding], None]] = None,
+                               retain_findings: bool = True,
+                               search_index: bool = False,
+                               fix: bool = False,
+                               ingredient_table: bool = False,
+                               json_ld: Optional[str] = None,
+                               site_host: Optional[str] = None) -> List[RecipeProjectValidator]:
+    """Validate several projects, parsing their files across a process pool"""
+    validators = [
+        RecipeProjectValidator(github_folder, project, cache, finding_sink, retain_findings,
+                               search_index=search_index, ingredient_table=ingredient_table, json_ld=json_ld,
+                               site_host=site_host)
+        for project in projects
+    ]
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        # Submit every chunk of every project up front so the pool stays busy;
+        # files with a valid cache entry are not sent to the pool at all
+        pending = []
+        for validator in validators:
+            with validator.timings.phase('cache_lookup'):
+                html_files = list(validator.recipe_folder.glob('*.html'))
+                validator.timings.add(files=len(html_files))
+                html_files = [str(path) for path in validator.documents.load_cached(html_files)]
+            futures = [
+                pool.submit(_parse_recipe_chunk, html_files[i:i + chunk_size])
+                for i in range(0, len(html_files), chunk_size)
+            ]
+            pending.append((validator, futures))
+        
+        # Project-level checks run here against the pre-parsed documents
+        for validator, futures in pending:
+            with validator.timings.phase('parallel_parse'):
+                for future in futures:
+                    records = future.result()
+                    validator.timings.add(files=len(records))
+                    for path, fingerprint, result in records:
+                        document = RecipeDocument(Path(path), None, result, fingerprint)
+                        validator.documents.add(document, parsed=True, bytes_read=fingerprint[1])
+            if fix:
+                validator.apply_fixes()
+            validator.validate_all()
+    
+    return validators
+
+
+def print_combined_report(validators: List[RecipeProjectValidator]):
+    """Print one QA report merging the results of several projects"""
+    findings = []
+    stats = defaultdict(int)
+    
+    for validator in validators:
+        # Projects limited to unchanged project-level inputs gathered no statistics
+        if validator.changed_files is None or validator.project_changed:
+            for key, value in validator.stats.items():
+                stats[key] += value
+        findings.extend(validator.findings)
+    
+    print(f"\n{'='*70}")
+    print(f"📊 COMBINED QA VALIDATION REPORT ({len(validators)} projects)")
+    print(f"{'='*70}\n")
+    
+    print("PROJECTS:")
+    for validator in validators:
+        changed = '' if validator.changed_files is None else f" ({len(validator.changed_files)} changed files)"
+        print(f"  • {validator.project_name}{changed}: "
+              f"{_count_issues(validator.findings, 'error')} errors, "
+              f"{_count_issues(validator.findings, 'warning')} warnings")
+    print()
+    
+    if stats:
+        _print_statistics(stats)
+    _print_findings(findings, show_project=True)
 
 
 def get_available_projects(github_folder: str) -> List[str]:
@@ -472,22 +3076,137 @@ def get_available_projects(github_folder: str) -> List[str]:
     return sorted(projects)
 
 
-def main():
-    """Main entry point"""
-    print("\n" + "="*70)
-    print("🍳 Recipe HTML Project QA Validator")
-    print("="*70)
+def git_changed_paths(github_folder: str, since: Optional[str] = None, staged: bool = False) -> Dict[str, str]:
+    """Ask git which files changed, as {path relative to github_folder: status letter}
     
-    # GitHub folder (hardcoded, but could be made configurable)
-    github_folder = "/Users/michelle/Documents/GitHub/2vrxjtz5yr-ui.github.io"
+    With staged, that is the index against HEAD; otherwise the working tree against
+    since, plus untracked files (as added). Raises OSError or CalledProcessError.
+    """
+    def git(*args: str) -> List[str]:
+        completed = subprocess.run(['git', '-C', str(github_folder), *args],
+                                   capture_output=True, check=True)
+        # -z output is NUL-terminated fields
+        return os.fsdecode(completed.stdout).split('\0')[:-1]
     
-    # Find available projects
-    projects = get_available_projects(github_folder)
+    if staged:
+        fields = git('diff', '--cached', '--name-status', '--no-renames', '--relative', '-z')
+    else:
+        fields = git('diff', '--name-status', '--no-renames', '--relative', '-z', since, '--')
+    changes = dict(zip(fields[1::2], fields[0::2]))
     
-    if not projects:
-        print("\n❌ No recipe projects found in the GitHub folder.")
-        return
+    if not staged:
+        for path in git('ls-files', '--others', '--exclude-standard', '-z'):
+            changes.setdefault(path, 'A')
+    return changes
+
+
+def git_staged_files(github_folder: Path, pathspec: str) -> List[str]:
+    """Paths in the git index matching pathspec, relative to github_folder"""
+    completed = subprocess.run(['git', '-C', str(github_folder), 'ls-files', '--cached', '-z', '--', pathspec],
+                               capture_output=True, check=True)
+    return os.fsdecode(completed.stdout).split('\0')[:-1]
+
+
+def git_staged_blobs(github_folder: Path, paths: List[str]) -> Dict[str, bytes]:
+    """Staged content of paths relative to github_folder, read with one git cat-file
+    
+    Paths not in the index are left out.
+    """
+    request = ''.join(f':./{path}\n' for path in paths)
+    completed = subprocess.run(['git', '-C', str(github_folder), 'cat-file', '--batch'],
+                               input=request.encode('utf-8'), capture_output=True, check=True)
+    output = completed.stdout
+    
+    # Each answer is "<oid> blob <size>" and the content, or "<name> missing"
+    blobs = {}
+    position = 0
+    for path in paths:
+        end = output.index(b'\n', position)
+        header = output[position:end].split()
+        position = end + 1
+        if header[-1] == b'missing':
+            continue
+        size = int(header[2])
+        blobs[path] = output[position:position + size]
+        position += size + 1
+    return blobs
+
+
+def validate_changes(github_folder: str, projects: List[str], changes: Dict[str, str],
+                     staged: bool = False,
+                     cache: Optional[ValidationCache] = None,
+                     finding_sink: Optional[Callable[[Finding], None]] = None,
+                     retain_findings: bool = True,
+                     json_ld: Optional[str] = None,
+                     site_host: Optional[str] = None) -> List[RecipeProjectValidator]:
+    """Validate only what changed in the given projects, skipping projects with no changes
+    
+    Runs in-process: the work is proportional to the change, so a process pool
+    would cost more than it saves.
+    """
+    validators = []
+    for project in projects:
+        validator = RecipeProjectValidator(github_folder, project, cache, finding_sink, retain_findings,
+                                           json_ld=json_ld, site_host=site_host)
+        if validator.limit_to_changes(changes, staged):
+            validator.validate_all()
+            validators.append(validator)
+    return validators
+
+
+def _watched_files(validator: RecipeProjectValidator) -> Dict[Path, Tuple[int, int]]:
+    """Snapshot (mtime_ns, size) of every file a project's checks read"""
+    paths = list(validator.recipe_folder.glob('*.html'))
+    paths += [validator.inventory_file, validator.index_file]
+    
+    snapshot = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def watch_project(validator: RecipeProjectValidator, interval: float = 0.5, show_timings: bool = False):
+    """Re-validate a project whenever its recipe files, inventory or index change
+    
+    Changes are detected by polling file stats (stdlib only, no inotify
+    dependency). Unchanged documents stay parsed in memory, and the
+    project-level checks are skipped unless the inventory, index or file
+    set changed, so each pass only redoes work for the edited files.
+    """
+    previous = _watched_files(validator)
     
+    while True:
+        started = time.perf_counter()
+        validator.reset_results()
+        validator.validate_all()
+        validator.print_report()
+        if show_timings:
+            validator.timings.print_table()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"⏱️  Validated in {elapsed_ms:.0f} ms")
+        print("👀 Watching for changes... (Ctrl+C to stop)")
+        
+        while True:
+            time.sleep(interval)
+            current = _watched_files(validator)
+            if current != previous:
+                break
+        
+        changed = [path for path in previous.keys() | current.keys()
+                   if previous.get(path) != current.get(path)]
+        for path in changed:
+            validator.documents.invalidate(path)
+        previous = current
+        
+        print(f"\n🔄 Changed: {', '.join(sorted(path.name for path in changed))}")
+
+
+def _prompt_for_project(projects: List[str]) -> Optional[str]:
+    """Ask the user which project to validate; None if they quit"""
     # Display available projects
     print("\n📚 Available recipe projects:\n")
     for i, project in enumerate(projects, 1):
@@ -501,22 +3220,329 @@ def main():
             
             if choice.lower() == 'q':
                 print("\n👋 Goodbye!\n")
-                return
+                return None
             
             choice_num = int(choice)
             if 1 <= choice_num <= len(projects):
-                selected_project = projects[choice_num - 1]
-                break
+                return projects[choice_num - 1]
             else:
                 print(f"❌ Please enter a number between 1 and {len(projects)}")
         except ValueError:
             print("❌ Please enter a valid number or 'q' to quit")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description="Validate recipe HTML projects")
+    parser.add_argument('--root', default=DEFAULT_GITHUB_FOLDER,
+                        help="GitHub folder containing the recipe projects")
+    parser.add_argument('--site-host', metavar='HOST',
+                        help="host of this site, whose absolute URLs are checked as local files "
+                             "(default: the name of the --root folder, e.g. <name>.github.io)")
+    parser.add_argument('--project',
+                        help="project to validate (skips the interactive prompt)")
+    parser.add_argument('--all', action='store_true',
+                        help="validate every project non-interactively, in parallel")
+    parser.add_argument('--jobs', type=int, default=None,
+                        help="worker processes for --all (default: CPU count)")
+    parser.add_argument('--prefetch', type=int, default=DEFAULT_PREFETCH_CONCURRENCY, metavar='N',
+                        help="read up to N files at a time on threads, parsing each as it arrives, before checking; "
+                             "may help on slow or network disks "
+                             f"(default: {DEFAULT_PREFETCH_CONCURRENCY}: stream each file into the parser in turn)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f"ignore and do not update {CACHE_FILE_NAME}")
+    parser.add_argument('--watch', action='store_true',
+                        help="keep running and re-validate the project when its files change "
+                             "(needs --project when stdin is not a terminal)")
+    parser.add_argument('--interval', type=float, default=0.5,
+                        help="polling interval in seconds for --watch (default: 0.5)")
+    parser.add_argument('--fix', action='store_true',
+                        help="before validating, rewrite the index link list and inventory statistics")
+    changed = parser.add_mutually_exclusive_group()
+    changed.add_argument('--changed-since', metavar='REF',
+                         help="only check files git reports changed since REF (plus untracked files); "
+                              "project-level checks run only where the inventory, index or file set changed")
+    changed.add_argument('--staged', action='store_true',
+                         help="like --changed-since, but for the changes staged for commit (for a pre-commit hook); "
+                              "changed pages, the inventory and the index are checked as staged, "
+                              "other pages as they are in the working tree")
+    parser.add_argument('--links', action='store_true',
+                        help="also check every link on the site (all folders, including archive)")
+    parser.add_argument('--search-index', action='store_true',
+                        help="write <index>-search.json, an ingredient/name search index for the site")
+    parser.add_argument('--ingredient-table', action='store_true',
+                        help="write recipe-ingredients.csv, every ingredient line with its amount in g/ml")
+    parser.add_argument('--json-ld', choices=['export', 'inject'],
+                        help="write every page's recipe as JSON-LD to recipes.jsonld (export), "
+                             "or into each page's <head> (inject)")
+    parser.add_argument('--timings', action='store_true',
+                        help="print wall time, files, bytes read and cache hit rate per phase")
+    parser.add_argument('--trace', metavar='FILE',
+                        help="write per-phase timings as a Chrome trace-event JSON file")
+    parser.add_argument('--profile', nargs='?', const='-', metavar='FILE',
+                        help="run under cProfile and print (or write to FILE) the top hotspots")
+    parser.add_argument('--format', choices=['text', 'json', 'jsonl'], default='text',
+                        help="report format; jsonl streams each finding as it is produced")
+    parser.add_argument('--strict', action='store_true',
+                        help=f"exit with status {EXIT_WARNINGS} when there are warnings but no errors")
+    return parser.parse_args(argv)
+
+
+def _report_timings(args: argparse.Namespace, validators: List[RecipeProjectValidator]):
+    """Print and/or write per-phase timings as requested on the command line"""
+    if args.timings:
+        for validator in validators:
+            validator.timings.print_table(f"PHASE TIMINGS ({validator.project_name})")
+    if args.trace:
+        write_trace(validators, args.trace)
+        print(f"📝 Trace written to {args.trace} (open in chrome://tracing or Perfetto)")
+
+
+def _write_profile(profiler: cProfile.Profile, destination: str):
+    """Write the hottest functions of a profiled run, by own time"""
+    if destination == '-':
+        print(f"\n{'='*70}")
+        print(f"🔥 PROFILE HOTSPOTS (top {PROFILE_TOP_FUNCTIONS} by own time)")
+        print(f"{'='*70}")
+        pstats.Stats(profiler).strip_dirs().sort_stats('tottime').print_stats(PROFILE_TOP_FUNCTIONS)
+        return
+    with open(destination, 'w', encoding='utf-8') as f:
+        stats = pstats.Stats(profiler, stream=f)
+        stats.strip_dirs().sort_stats('tottime').print_stats(PROFILE_TOP_FUNCTIONS)
+    print(f"📝 Profile written to {destination}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point"""
+    args = parse_args(argv)
+    
+    if args.profile is None:
+        return run(args)
+    
+    # Worker processes used by --all are not included in the profile
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(run, args)
+    finally:
+        # Keep stdout for the machine-readable report
+        out = sys.stdout if args.format == 'text' else sys.stderr
+        with contextlib.redirect_stdout(out):
+            _write_profile(profiler, args.profile)
+
+
+def _jsonl_sink(stream) -> Callable[[Finding], None]:
+    """Finding sink writing one JSON object per line, flushed immediately"""
+    def write(finding: Finding):
+        stream.write(json.dumps({'type': 'finding', **finding.to_dict()}, ensure_ascii=False) + '\n')
+        stream.flush()
+    return write
+
+
+def _project_summary(validator: RecipeProjectValidator) -> Dict:
+    """Machine-readable statistics for one validated project"""
+    return {
+        'project': validator.project_name,
+        'stats': validator.stats,
+        'errors': validator.finding_counts['error'],
+        'warnings': validator.finding_counts['warning'],
+        'inventory_matches': {
+            name: {'file': filename, 'similarity': round(score, 3)}
+            for name, (filename, score) in sorted(validator.inventory_matches.items())
+        },
+    }
+
+
+def _exit_code(validators: List[RecipeProjectValidator], strict: bool) -> int:
+    """EXIT_ERRORS if any errors, EXIT_WARNINGS for warnings under --strict, else EXIT_OK"""
+    if any(validator.finding_counts['error'] for validator in validators):
+        return EXIT_ERRORS
+    if strict and any(validator.finding_counts['warning'] for validator in validators):
+        return EXIT_WARNINGS
+    return EXIT_OK
+
+
+def _check_links(github_folder: str, cache: Optional[ValidationCache],
+                 sink: Optional[Callable[[Finding], None]], site_host: Optional[str] = None) -> SiteLinkChecker:
+    """Run the site-wide link check, printing its report in text mode"""
+    checker = SiteLinkChecker(github_folder, cache, sink, retain_findings=sink is None, site_host=site_host)
+    checker.check()
+    if sink is None:
+        checker.print_report()
+    return checker
+
+
+def run(args: argparse.Namespace) -> int:
+    """Validate the project(s) selected by the command-line options"""
+    if args.format == 'text':
+        return _run(args, None, None)
+    
+    # Keep stdout for machine-readable output; progress lines go to stderr
+    out = sys.stdout
+    findings = []
+    sink = _jsonl_sink(out) if args.format == 'jsonl' else findings.append
+    with contextlib.redirect_stdout(sys.stderr):
+        validators = []
+        exit_code = _run(args, sink, validators)
+    
+    summary = {
+        'errors': sum(validator.finding_counts['error'] for validator in validators),
+        'warnings': sum(validator.finding_counts['warning'] for validator in validators),
+        'exit_code': exit_code,
+        'projects': [_project_summary(validator) for validator in validators],
+    }
+    if args.format == 'jsonl':
+        out.write(json.dumps({'type': 'summary', **summary}, ensure_ascii=False) + '\n')
+    else:
+        json.dump({**summary, 'findings': [finding.to_dict() for finding in findings]},
+                  out, ensure_ascii=False, indent=2)
+        out.write('\n')
+    return exit_code
+
+
+def _run(args: argparse.Namespace, sink: Optional[Callable[[Finding], None]],
+         validators: Optional[List[RecipeProjectValidator]]) -> int:
+    """Run the validation; with a sink, findings are streamed instead of reported as text"""
+    print("\n" + "="*70)
+    print("🍳 Recipe HTML Project QA Validator")
+    print("="*70)
+    
+    github_folder = args.root
+    text = sink is None
+    
+    # Find available projects
+    projects = get_available_projects(github_folder)
+    
+    if not projects:
+        print("\n❌ No recipe projects found in the GitHub folder.")
+        return EXIT_ERRORS
+    
+    if args.all and args.watch:
+        print("\n❌ --watch validates a single project and cannot be combined with --all")
+        return EXIT_USAGE
+    
+    if args.watch and not text:
+        print("\n❌ --watch only supports --format text")
+        return EXIT_USAGE
+    
+    if args.watch and args.fix:
+        print("\n❌ --fix cannot be combined with --watch")
+        return EXIT_USAGE
+    
+    if args.watch and args.json_ld == 'inject':
+        print("\n❌ --json-ld inject cannot be combined with --watch")
+        return EXIT_USAGE
+    
+    if args.watch and args.links:
+        print("\n❌ --links checks the whole site once and cannot be combined with --watch")
+        return EXIT_USAGE
+    
+    changed_only = args.changed_since is not None or args.staged
+    if changed_only and (args.watch or args.fix or args.search_index or args.ingredient_table
+                         or args.json_ld == 'export'):
+        print("\n❌ --changed-since and --staged cannot be combined with --watch, --fix, "
+              "--search-index, --ingredient-table or --json-ld export")
+        return EXIT_USAGE
+    
+    if args.staged and args.json_ld == 'inject':
+        print("\n❌ --json-ld inject writes the working tree and cannot be combined with --staged")
+        return EXIT_USAGE
+    
+    if args.project and args.project not in projects:
+        print(f"\n❌ Unknown project: {args.project}")
+        return EXIT_USAGE
+    
+    if args.watch and not args.project and not sys.stdin.isatty():
+        print("\n❌ --watch needs --project when there is no terminal to prompt for one")
+        return EXIT_USAGE
+    
+    # Without a terminal there is nobody to answer the prompt (e.g. CI): validate everything
+    validate_all_projects = args.all or (not args.project and not sys.stdin.isatty())
+    
+    cache = None
+    if not args.no_cache:
+        cache = ValidationCache(Path(github_folder) / CACHE_FILE_NAME, Path(github_folder))
+    elif args.watch:
+        # Watch mode relies on the cache to skip unchanged project-level checks
+        cache = ValidationCache(None, Path(github_folder))
+    
+    if validators is None:
+        validators = []
+    
+    if changed_only:
+        try:
+            changes = git_changed_paths(github_folder, args.changed_since, args.staged)
+            validators.extend(validate_changes(
+                github_folder, [args.project] if args.project else projects, changes, args.staged,
+                cache=cache, finding_sink=sink, retain_findings=text, json_ld=args.json_ld,
+                site_host=args.site_host,
+            ))
+        except (OSError, subprocess.CalledProcessError) as e:
+            detail = getattr(e, 'stderr', None)
+            detail = os.fsdecode(detail).strip() if detail else str(e)
+            print(f"\n❌ Could not read changes from git: {detail}")
+            return EXIT_USAGE
+        if text:
+            if validators:
+                print_combined_report(validators)
+            else:
+                print("\n✅ No recipe project files changed.\n")
+        if args.links:
+            validators.append(_check_links(github_folder, cache, sink, args.site_host))
+        if cache is not None:
+            cache.save()
+        _report_timings(args, validators)
+        return _exit_code(validators, args.strict)
+    
+    if validate_all_projects:
+        validators.extend(validate_projects_parallel(
+            github_folder, projects, max_workers=args.jobs, cache=cache,
+            finding_sink=sink, retain_findings=text, search_index=args.search_index, fix=args.fix,
+            ingredient_table=args.ingredient_table, json_ld=args.json_ld, site_host=args.site_host,
+        ))
+        if text:
+            print_combined_report(validators)
+        if args.links:
+            validators.append(_check_links(github_folder, cache, sink, args.site_host))
+        if cache is not None:
+            cache.save()
+        _report_timings(args, validators)
+        return _exit_code(validators, args.strict)
+    
+    if args.project:
+        selected_project = args.project
+    else:
+        selected_project = _prompt_for_project(projects)
+        if selected_project is None:
+            return EXIT_OK
     
     # Run validation
-    validator = RecipeProjectValidator(github_folder, selected_project)
+    validator = RecipeProjectValidator(github_folder, selected_project, cache, sink,
+                                       retain_findings=text, prefetch_concurrency=args.prefetch,
+                                       search_index=args.search_index, ingredient_table=args.ingredient_table,
+                                       json_ld=args.json_ld, site_host=args.site_host)
+    validators.append(validator)
+    
+    if args.watch:
+        try:
+            watch_project(validator, args.interval, args.timings)
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching.\n")
+        finally:
+            cache.save()
+        return EXIT_OK
+    
+    if args.fix:
+        validator.apply_fixes()
     errors, warnings, stats = validator.validate_all()
-    validator.print_report()
+    if text:
+        validator.print_report()
+    if args.links:
+        validators.append(_check_links(github_folder, cache, sink, args.site_host))
+    if cache is not None:
+        cache.save()
+    _report_timings(args, validators)
+    return _exit_code(validators, args.strict)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())